@@ -0,0 +1,48 @@
+"""
+Cost of committing the objects queued during a training session, run as 'python -m benchmarks.bulk_commit' from the
+root of the repository. Compares 'UpdateContext.on_exit' against creating the objects one request at a time, with every
+request to the fake client taking 'LATENCY' seconds.
+"""
+
+from time import perf_counter
+from pylurch.contract.client.context import TrainingContext
+from pylurch.contract.database import TrainingSession
+from test.fakes import FakeClient
+
+LABELS = 5_000
+SCORES = 50
+PACKAGES = 50
+LATENCY = 0.001
+
+
+def fill(context: TrainingContext):
+    context.add_labels([f"label-{i}" for i in range(LABELS)])
+    context.add_scores({f"score-{i}": float(i) for i in range(SCORES)})
+    context.add_packages({f"package-{i}": "1.0.0" for i in range(PACKAGES)})
+
+
+def per_object(context: TrainingContext):
+    for objs in context._drain().values():
+        for obj in objs:
+            context._client.create(obj, batched=True)
+
+
+def main():
+    for name, commit in (("per object", per_object), ("on_exit", TrainingContext.on_exit)):
+        client = FakeClient(latency=LATENCY)
+        context = TrainingContext(client, TrainingSession(id=1, model_id=1, name="benchmark", version=1))
+
+        fill(context)
+
+        start = perf_counter()
+        commit(context)
+        elapsed = perf_counter() - start
+
+        print(f"{name:>10}: {client.requests:>5} requests, {elapsed:6.2f} s")
+
+        for table, (count, seconds) in context.commit_stats.items():
+            print(f"{'':>12}{table}: {count} objects in {seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
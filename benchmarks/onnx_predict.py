@@ -0,0 +1,66 @@
+"""
+Allocations and time of the default ONNX 'predict', run as 'python -m benchmarks.onnx_predict' from the root of the
+repository. Compares DataFrame, array and preallocated output inputs against converting and wrapping with copies.
+"""
+
+import tracemalloc
+from time import perf_counter
+import numpy as np
+import pandas as pd
+from example.models.regression import LinearRegressionBlueprint
+
+ROWS = 100_000
+COLUMNS = 50
+REPEATS = 20
+
+
+def copying(blueprint, container, x):
+    # NB: the conversions done by 'predict' before avoiding copies
+    values = x.values.astype(np.float32)
+    res = container.model.run(None, {container.model.get_inputs()[0].name: values})[0]
+
+    return pd.DataFrame(res, index=x.index, columns=["y"])
+
+
+def measure(f):
+    f()
+
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = perf_counter()
+
+    for _ in range(REPEATS):
+        f()
+
+    return peak, (perf_counter() - start) / REPEATS
+
+
+def main():
+    x = pd.DataFrame(np.random.rand(ROWS, COLUMNS).astype(np.float32))
+    y = x.sum(axis=1)
+
+    blueprint = LinearRegressionBlueprint()
+    container = blueprint.fit(blueprint.make_model(), x, y)
+    container = blueprint.deserialize(blueprint.serialize(container, x=x, y=y))
+
+    # NB: frames keep their values column major, so only row major arrays can be passed on as is
+    array = np.ascontiguousarray(x.to_numpy())
+    out = np.empty((ROWS, 1), dtype=np.float32)
+
+    cases = {
+        "copying": lambda: copying(blueprint, container, x),
+        "frame": lambda: blueprint.predict(container, x),
+        "array": lambda: blueprint.predict(container, array),
+        "array, out": lambda: blueprint.predict(container, array, out=out),
+    }
+
+    for name, f in cases.items():
+        peak, seconds = measure(f)
+        print(f"{name:>12}: peak {peak / 1024 ** 2:6.1f} MB, {1_000 * seconds:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Throughput of 'RQRunner' against an in-memory Redis, run as 'python -m benchmarks.rq_throughput' from the root of the
+repository. Reports the number of RQ jobs per task, and the rates of enqueuing and working off the tasks.
+"""
+
+from time import perf_counter
+import fakeredis
+from rq import SimpleWorker
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import RQRunner
+from test.fakes import FakeClient
+
+TASKS = 1_000
+
+
+def double(x, task_obj=None):
+    return 2 * x
+
+
+def main():
+    conn = fakeredis.FakeStrictRedis()
+    runner = RQRunner(conn, FakeClient())
+
+    start = perf_counter()
+    keys = [runner.enqueue(double, i) for i in range(TASKS)]
+    enqueue = perf_counter() - start
+
+    jobs = len(conn.keys("rq:job:*"))
+
+    start = perf_counter()
+    SimpleWorker(runner.queues, connection=conn).work(burst=True, logging_level="WARNING")
+    work = perf_counter() - start
+
+    done = sum(runner.check_status(k) == Status.Done for k in keys)
+
+    print(f"tasks: {TASKS}, done: {done}, jobs per task: {jobs / TASKS:.1f}")
+    print(f"enqueue: {TASKS / enqueue:,.0f} tasks/s, work: {TASKS / work:,.0f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Latency of looking up the latest successful training session in sqlite, run as 'python -m benchmarks.session_lookup'
+from the root of the repository. Compares filtering on the materialized 'has_model' against the correlated subquery
+into 'Artifact' it replaced.
+"""
+
+import random
+from time import perf_counter
+from sqlalchemy import create_engine, select, exists
+from sqlalchemy.orm import Session
+from pylurch.contract import database as db
+from pylurch.contract.enums import ArtifactType, Backend
+
+MODELS = 100
+NAMES = 5
+SESSIONS = 50_000
+LOOKUPS = 2_000
+
+
+def populate(session: Session):
+    session.bulk_insert_mappings(db.Model, [dict(id=i + 1, name=f"model-{i}", revision="1") for i in range(MODELS)])
+
+    versions = dict()
+    sessions = list()
+
+    for i in range(SESSIONS):
+        key = (random.randint(1, MODELS), f"session-{random.randrange(NAMES)}")
+        versions[key] = versions.get(key, 0) + 1
+
+        sessions.append(dict(id=i + 1, model_id=key[0], name=key[1], version=versions[key], has_model=False))
+
+    session.bulk_insert_mappings(db.TrainingSession, sessions)
+
+    artifacts = [
+        dict(session_id=i + 1, type_=ArtifactType.Model, backend=Backend.ONNX, bytes=b"")
+        for i in range(SESSIONS)
+        if i % 2 == 0
+    ]
+
+    session.bulk_insert_mappings(db.Artifact, artifacts)
+
+    # NB: bulk inserts bypass the listeners keeping 'has_model' current
+    db.backfill_has_model(session.connection())
+    session.commit()
+
+
+def subquery_lookup(session: Session, model_id: int, name: str):
+    has_model = exists(
+        select(db.Artifact.id).where(
+            (db.Artifact.session_id == db.TrainingSession.id) & (db.Artifact.type_ == ArtifactType.Model)
+        )
+    )
+
+    return (
+        session.query(db.TrainingSession)
+        .filter((db.TrainingSession.model_id == model_id) & (db.TrainingSession.name == name) & has_model)
+        .order_by(db.TrainingSession.id.desc())
+        .first()
+    )
+
+
+def column_lookup(session: Session, model_id: int, name: str):
+    return (
+        session.query(db.TrainingSession)
+        .filter(
+            (db.TrainingSession.model_id == model_id)
+            & (db.TrainingSession.name == name)
+            & (db.TrainingSession.has_model == True)
+        )
+        .order_by(db.TrainingSession.id.desc())
+        .first()
+    )
+
+
+def main():
+    engine = create_engine("sqlite://")
+    db.Base.metadata.create_all(engine)
+
+    session = Session(engine)
+    populate(session)
+
+    keys = [(random.randint(1, MODELS), f"session-{random.randrange(NAMES)}") for _ in range(LOOKUPS)]
+
+    for name, lookup in (("subquery", subquery_lookup), ("column", column_lookup)):
+        start = perf_counter()
+
+        for model_id, session_name in keys:
+            lookup(session, model_id, session_name)
+            session.expunge_all()
+
+        print(f"{name:>8}: {1_000 * (perf_counter() - start) / LOOKUPS:.3f} ms per lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Encoding time, decoding time and size of the wire formats of frames, run as 'python -m benchmarks.wire_format' from
+the root of the repository. Compares the JSON orient path against the binary Npy and Arrow encodings.
+"""
+
+from time import perf_counter
+import numpy as np
+import pandas as pd
+from pylurch.contract.enums import Encoding
+from pylurch.contract.serialization import encode, decode
+
+ROWS = 100_000
+COLUMNS = 20
+REPEATS = 5
+
+
+def timed(f):
+    start = perf_counter()
+
+    for _ in range(REPEATS):
+        result = f()
+
+    return result, (perf_counter() - start) / REPEATS
+
+
+def main():
+    x = pd.DataFrame(np.random.rand(ROWS, COLUMNS).astype(np.float32), columns=[f"x{i}" for i in range(COLUMNS)])
+
+    for encoding in Encoding:
+        try:
+            data, encoding_time = timed(lambda: encode(x, encoding))
+        except ImportError as exc:
+            print(f"{encoding.value:>6}: skipped, {exc}")
+            continue
+
+        _, decoding_time = timed(lambda: decode(data, encoding))
+
+        print(
+            f"{encoding.value:>6}: encode {1_000 * encoding_time:8.1f} ms, decode {1_000 * decoding_time:8.1f} ms, "
+            f"size {len(data) / 1024 ** 2:6.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ import os
 from time import sleep
 from numpy.random import uniform
 from pyalfred.server.resources import DatabaseResource
-from pylurch.contract.database import Base, BaseMixin
+from pylurch.contract.database import Base, BaseMixin, READ_ONLY
+from pylurch.server.sessions import make_session_endpoint, SESSION_ENDPOINT
 from pyalfred.contract.schema import AutoMarshmallowSchema
 from pyalfred.server.utils import make_base_logger
 
@@ -25,7 +26,13 @@ def init_app():
 
     for base in AutoMarshmallowSchema.get_subclasses(Base):
         s = AutoMarshmallowSchema.generate_schema(base)
-        api.add_route(f"/{s.endpoint()}", DatabaseResource.make_endpoint(s, Session, mixin_ignore=BaseMixin))
+        api.add_route(
+            f"/{s.endpoint()}",
+            DatabaseResource.make_endpoint(s, Session, mixin_ignore=BaseMixin),
+            methods=["GET"] if base in READ_ONLY else None,
+        )
+
+    api.add_route(f"/{SESSION_ENDPOINT}", make_session_endpoint(Session))
 
     logger = make_base_logger(__name__)
     logger.info("Successfully registered all views")
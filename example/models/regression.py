@@ -35,7 +35,12 @@ class LinearRegressionBlueprint(InferenceModelBlueprint[LinearRegression, rt.Inf
         if len(artifacts) > 1:
             raise ValueError("Cannot handle more than one artifact!")
 
-        return LoadedContainer(rt.InferenceSession(artifacts[0].bytes), artifacts[0].backend)
+        # NB: onnxruntime only accepts 'bytes' or a path, so artifacts on disk are loaded from their file directly
+        model = artifacts[0].path or artifacts[0].bytes
+        if not isinstance(model, (bytes, str)):
+            model = bytes(model)
+
+        return LoadedContainer(self.make_onnx_session(model), artifacts[0].backend)
 
 
 class LogisticRegressionBlueprint(LinearRegressionBlueprint):
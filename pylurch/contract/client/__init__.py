@@ -1 +1,2 @@
 from .session import SessionClient
+from .asynchronous import AsyncSessionClient
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Sequence, List, Union, Callable, Any
+from ..database import TrainingSession, Artifact
+from ..enums import ArtifactType
+from ..storage import ArtifactStore
+from .session import SessionClient
+from .transport import make_http_session
+from .context import TrainingContext, PredictionContext, UpdateContext
+
+
+class AsyncSessionClient(object):
+    def __init__(
+        self,
+        base_url: str,
+        store: ArtifactStore = None,
+        atomic_sessions: bool = False,
+        pool_size: int = 10,
+        client: SessionClient = None,
+    ):
+        """
+        Asyncio variant of 'SessionClient'. Requests are issued on a pool of 'pool_size' threads, each with a client of
+        its own, so independent lookups may be awaited concurrently without blocking the event loop. The clients share
+        the keep-alive connections of the requests issued by 'SessionClient' itself, see its docstring. If 'client' is
+        passed it is instead shared by all threads, and must then be thread safe. Do note that the returned contexts
+        are the synchronous ones.
+        """
+
+        self._shared = client
+        self._http = client.http if client is not None else make_http_session(pool_size)
+        self._factory = partial(
+            SessionClient, base_url, store=store, atomic_sessions=atomic_sessions, pool_size=pool_size, http=self._http
+        )
+
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(pool_size)
+
+    @property
+    def client(self) -> SessionClient:
+        """
+        Returns the client of the calling thread.
+        """
+
+        if self._shared is not None:
+            return self._shared
+
+        client = getattr(self._local, "client", None)
+
+        if client is None:
+            client = self._local.client = self._factory()
+
+        return client
+
+    async def _run(self, f: Callable[..., Any], *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(f, *args, **kwargs))
+
+    async def _call(self, name: str, *args, **kwargs):
+        return await self._run(lambda: getattr(self.client, name)(*args, **kwargs))
+
+    async def begin_training_session(self, model_name: str, model_revision: str, session_name: str) -> TrainingContext:
+        return await self._call("begin_training_session", model_name, model_revision, session_name)
+
+    async def begin_update_session(self, new_session_name: str, old_training_session: int) -> UpdateContext:
+        return await self._call("begin_update_session", new_session_name, old_training_session)
+
+    async def begin_prediction_session(self, session_id: int) -> PredictionContext:
+        return await self._call("begin_prediction_session", session_id)
+
+    async def get_session(
+        self, model_name: str, model_revision: str, session_name: str, only_succeeded=False
+    ) -> Union[TrainingSession, None]:
+        return await self._call(
+            "get_session", model_name, model_revision, session_name, only_succeeded=only_succeeded
+        )
+
+    async def get_results(
+        self, session_ids: Sequence[int], types: Sequence[ArtifactType] = None
+    ) -> List[Union[Artifact, List[Artifact]]]:
+        async def get(session_id):
+            context = await self.begin_prediction_session(session_id)
+            return await self._run(context.get_result, types=types)
+
+        return list(await asyncio.gather(*(get(s) for s in session_ids)))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self._http.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -1,17 +1,23 @@
 from pyalfred.contract.client import Client
 from ...database import TrainingSession, SessionException
+from ...storage import ArtifactStore
 
 
 # TODO: Move context?
 class Context(object):
-    def __init__(self, client: Client, training_session: TrainingSession):
+    def __init__(self, client: Client, training_session: TrainingSession, store: ArtifactStore = None):
         self._client = client
         self._session = training_session
+        self._store = store
 
     @property
     def session(self):
         return self._session
 
+    @property
+    def store(self):
+        return self._store
+
     def __enter__(self):
         return self
 
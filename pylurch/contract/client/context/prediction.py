@@ -1,5 +1,7 @@
-from typing import Union, List
-from ...database import Artifact
+from functools import reduce
+from typing import Union, List, Sequence
+from ...database import Artifact, ArtifactMeta
+from ...enums import Storage, ArtifactType
 from .base import Context
 
 
@@ -7,8 +9,37 @@ class PredictionContext(Context):
     def on_exit(self):
         return
 
-    def _get_result(self, session_id: int) -> Union[Artifact, List[Artifact]]:
-        return self._client.get(Artifact, lambda u: u.session_id == session_id)
+    def _load_artifact(self, artifact: Artifact) -> Artifact:
+        if artifact.storage in (None, Storage.Database):
+            return artifact
 
-    def get_result(self):
-        return self._get_result(self._session.id)
+        if (self._store is None) or (self._store.backend != artifact.storage):
+            raise ValueError(f"No store configured for artifacts with storage {artifact.storage}!")
+
+        artifact.bytes = self._store.get(artifact.hash_)
+        artifact.path = self._store.locate(artifact.hash_)
+
+        return artifact
+
+    def _list_artifacts(self, session_id: int) -> List[ArtifactMeta]:
+        return self._client.get(ArtifactMeta, lambda u: u.session_id == session_id)
+
+    def _get_result(self, session_id: int, types: Sequence[ArtifactType] = None) -> Union[Artifact, List[Artifact]]:
+        def f(u: Artifact):
+            if not types:
+                return u.session_id == session_id
+
+            return (u.session_id == session_id) & reduce(lambda x, y: x | y, (u.type_ == t for t in types))
+
+        result = self._client.get(Artifact, f)
+
+        if isinstance(result, Artifact):
+            return self._load_artifact(result)
+
+        return [self._load_artifact(a) for a in result]
+
+    def list_artifacts(self) -> List[ArtifactMeta]:
+        return self._list_artifacts(self._session.id)
+
+    def get_result(self, types: Sequence[ArtifactType] = None):
+        return self._get_result(self._session.id, types=types)
@@ -4,8 +4,8 @@ from .update import UpdateContext
 
 
 class TrainingContext(UpdateContext):
-    def __init__(self, client, training_session):
-        super().__init__(client, training_session, None)
+    def __init__(self, client, training_session, store=None):
+        super().__init__(client, training_session, None, store=store)
 
     def add_label(self, label: str):
         self._to_commit.put(Label(session_id=self._session.id, label=label))
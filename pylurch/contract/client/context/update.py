@@ -1,30 +1,68 @@
-from queue import Queue
-from typing import Sequence
+from queue import Queue, Empty
+from time import perf_counter
+from typing import Sequence, Dict, Tuple, List
 from .prediction import PredictionContext
 from ...database import Artifact, TrainingSession
+from ...storage import hash_bytes
+from ...enums import Storage
 
 
 # TODO: Should inherit from both
 class UpdateContext(PredictionContext):
-    def __init__(self, client, training_session, old_session: TrainingSession):
-        super().__init__(client, training_session)
+    def __init__(self, client, training_session, old_session: TrainingSession, store=None):
+        super().__init__(client, training_session, store=store)
         self._old_session = old_session
         self._to_commit = Queue()
+        self._commit_stats = dict()  # type: Dict[str, Tuple[int, float]]
 
-    def get_result(self):
-        return self._get_result(self._old_session.id)
+    @property
+    def commit_stats(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Number of objects committed and seconds spent per table during the last 'on_exit'.
+        """
+
+        return self._commit_stats
+
+    def list_artifacts(self):
+        return self._list_artifacts(self._old_session.id)
+
+    def get_result(self, types=None):
+        return self._get_result(self._old_session.id, types=types)
 
     def add_artifact(self, artifact: Artifact):
         artifact.session_id = self.session.id
+        artifact.size = len(artifact.bytes)
+
+        if self._store is None:
+            artifact.hash_ = hash_bytes(artifact.bytes)
+            artifact.storage = Storage.Database
+        else:
+            artifact.hash_ = self._store.put(artifact.bytes)
+            artifact.storage = self._store.backend
+            artifact.bytes = None
+
         self._to_commit.put(artifact)
 
     def add_artifacts(self, artifacts: Sequence[Artifact]):
         for a in artifacts:
             self.add_artifact(a)
 
+    def _drain(self) -> Dict[type, List[object]]:
+        grouped = dict()
+
+        while True:
+            try:
+                obj = self._to_commit.get_nowait()
+            except Empty:
+                return grouped
+
+            grouped.setdefault(type(obj), list()).append(obj)
+
     def on_exit(self):
-        for to_commit in iter(self._to_commit.get, None):
-            self._client.create(to_commit, batched=True)
+        self._commit_stats = dict()
+
+        for table, objs in self._drain().items():
+            start = perf_counter()
+            self._client.create(objs, batched=True)
 
-            if self._to_commit.empty():
-                return
+            self._commit_stats[table.__tablename__] = (len(objs), perf_counter() - start)
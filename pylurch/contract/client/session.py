@@ -1,12 +1,46 @@
 from typing import Union
+import requests
 from pyalfred.contract.client import Client
 from ..database import TrainingSession, Model, BaseMixin
+from ..schema import BeginSessionRequest, BeginSessionResponse, SESSION_ENDPOINT
+from ..storage import ArtifactStore
 from .context import TrainingContext, PredictionContext, UpdateContext
+from .transport import make_http_session
 
 
 class SessionClient(Client):
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        store: ArtifactStore = None,
+        atomic_sessions: bool = False,
+        pool_size: int = 10,
+        http: requests.Session = None,
+    ):
+        """
+        Client for managing training sessions. If 'atomic_sessions' is set, sessions are begun in a single request to
+        the endpoint created by 'pylurch.server.sessions.make_session_endpoint', which must then be registered on the
+        server. Requests issued by this class itself reuse a pool of 'pool_size' keep-alive connections, or the ones of
+        'http' if passed. Do note that the inherited CRUD methods use the transport of 'pyalfred', and thus not the
+        pool.
+        """
+
         super().__init__(base_url, mixin_ignore=BaseMixin)
+        self._address = base_url.rstrip("/")
+        self._http = http or make_http_session(pool_size)
+        self._store = store
+        self._atomic_sessions = atomic_sessions
+
+    @property
+    def http(self) -> requests.Session:
+        return self._http
+
+    @property
+    def store(self) -> ArtifactStore:
+        return self._store
+
+    def close(self):
+        self._http.close()
 
     def _get_session(self, model_id: int, session_name: str, only_succeeded=False, latest=True):
         def f(u: TrainingSession):
@@ -24,11 +58,32 @@ class SessionClient(Client):
         latest_session = self._get_session(model_id, session_name)
 
         session = TrainingSession(
-            model_id=model_id, name=session_name, version=1 if latest_session is None else (latest_session.version + 1),
+            model_id=model_id,
+            name=session_name,
+            version=1 if latest_session is None else (latest_session.version + 1),
+            has_model=False,
         )
 
         return self.create(session)
 
+    def _begin_session(self, session_name: str, **kwargs) -> TrainingSession:
+        body = BeginSessionRequest().dump(dict(session_name=session_name, **kwargs))
+        resp = self._http.post(f"{self._address}/{SESSION_ENDPOINT}", json=body)
+
+        # NB: errors not handled by the endpoint, or raised before reaching it, need not be JSON
+        if not resp.headers.get("Content-Type", "").startswith("application/json"):
+            resp.raise_for_status()
+            raise ValueError(f"Unexpected response from '{SESSION_ENDPOINT}': {resp.text[:200]}")
+
+        result = BeginSessionResponse().load(resp.json())
+
+        if resp.status_code != 200:
+            raise ValueError(result.get("message"))
+
+        return TrainingSession(
+            id=result["id"], model_id=result["model_id"], name=result["name"], version=result["version"]
+        )
+
     def _get_model(self, name: str, revision: str) -> Model:
         return self.get(Model, lambda u: (u.name == name) & (u.revision == revision), one=True)
 
@@ -41,10 +96,14 @@ class SessionClient(Client):
         return self.create(Model(name=name, revision=revision))
 
     def begin_training_session(self, model_name: str, model_revision: str, session_name: str):
+        if self._atomic_sessions:
+            session = self._begin_session(session_name, model_name=model_name, model_revision=model_revision)
+            return TrainingContext(self, session, store=self._store)
+
         model = self._get_create_model(model_name, model_revision)
         session = self._create_session(model.id, session_name)
 
-        return TrainingContext(self, session)
+        return TrainingContext(self, session, store=self._store)
 
     def begin_update_session(self, new_session_name: str, old_training_session: int):
         old_session = self.get(TrainingSession, lambda u: u.id == old_training_session, one=True)
@@ -52,9 +111,12 @@ class SessionClient(Client):
         if (old_session is None) or not old_session.has_model:
             raise ValueError(f"The TrainingSession with id {old_training_session} does not exist!")
 
-        new_session = self._create_session(old_session.model_id, new_session_name)
+        if self._atomic_sessions:
+            new_session = self._begin_session(new_session_name, old_session_id=old_session.id)
+        else:
+            new_session = self._create_session(old_session.model_id, new_session_name)
 
-        return UpdateContext(self, new_session, old_session)
+        return UpdateContext(self, new_session, old_session, store=self._store)
 
     def begin_prediction_session(self, session_id: int):
         session = self.get(TrainingSession, lambda u: u.id == session_id, one=True)
@@ -62,11 +124,15 @@ class SessionClient(Client):
         if session is None:
             raise ValueError(f"No {TrainingSession.__name__} exists with id: {session_id}!")
 
-        return PredictionContext(self, session)
+        return PredictionContext(self, session, store=self._store)
 
     def get_session(
         self, model_name: str, model_revision: str, session_name: str, only_succeeded=False
     ) -> Union[TrainingSession, None]:
 
         model = self._get_model(model_name, model_revision)
+
+        if model is None:
+            return None
+
         return self._get_session(model.id, session_name, only_succeeded=only_succeeded)
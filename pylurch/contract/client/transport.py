@@ -0,0 +1,17 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def make_http_session(pool_size: int = 10, max_retries: int = 0) -> requests.Session:
+    """
+    Creates a 'requests.Session' keeping up to 'pool_size' connections alive per host, allowing as many concurrent
+    requests to reuse connections.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries)
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
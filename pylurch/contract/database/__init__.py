@@ -22,4 +22,20 @@ Base = declarative_base()
 SERIALIZATION_IGNORE = tuple(k for (k, v) in vars(BaseMixin).items() if isinstance(v, Column))
 
 from .task import Task, TaskMeta, TaskException
-from .inference import Score, TrainingSession, Model, UpdatedSession, Artifact, Label, Package, SessionException
+from .inference import (
+    Score,
+    TrainingSession,
+    Model,
+    UpdatedSession,
+    Artifact,
+    ArtifactMeta,
+    Label,
+    Package,
+    SessionException,
+    backfill_has_model,
+)
+
+
+# NB: views onto other tables, which must only be exposed for reading as writes would bypass the listeners of the
+# underlying table
+READ_ONLY = (ArtifactMeta,)
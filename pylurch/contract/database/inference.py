@@ -1,8 +1,22 @@
-from sqlalchemy import Column, String, LargeBinary, Integer, ForeignKey, Enum, UniqueConstraint, select, Float
+from sqlalchemy import (
+    Column,
+    String,
+    LargeBinary,
+    Integer,
+    BigInteger,
+    ForeignKey,
+    Enum,
+    UniqueConstraint,
+    Float,
+    Boolean,
+    Index,
+    event,
+    select,
+    inspect,
+)
 from sqlalchemy.orm import column_property
 from . import Base, BaseMixin
-from ..enums import Backend, ArtifactType
-from .utils import custom_column_property
+from ..enums import Backend, ArtifactType, Storage
 from .exception import ExceptionTemplate
 
 
@@ -14,12 +28,36 @@ class Model(BaseMixin, Base):
 
 
 class Artifact(BaseMixin, Base):
-    session_id = Column(Integer, ForeignKey("TrainingSession.id"), nullable=False)
-    type_ = Column(Enum(ArtifactType, create_constraint=False, native_enum=False), nullable=False)
+    # NB: the previous values are needed by the listeners below, and are thus loaded on change if expired
+    session_id = column_property(Column(Integer, ForeignKey("TrainingSession.id"), nullable=False), active_history=True)
+    type_ = column_property(
+        Column(Enum(ArtifactType, create_constraint=False, native_enum=False), nullable=False), active_history=True
+    )
     backend = Column(Enum(Backend, create_constraint=False, native_enum=False), nullable=False)
-    bytes = Column(LargeBinary(), nullable=False)
+    bytes = Column(LargeBinary(), nullable=True)
+
+    storage = Column(
+        Enum(Storage, create_constraint=False, native_enum=False), nullable=False, default=Storage.Database
+    )
+    hash_ = Column(String(64), nullable=True)
+    size = Column(BigInteger(), nullable=True)
+
+    # NB: not persisted, set when loaded from a store keeping the artifact in a local file
+    path = None  # type: str
+
+    __table_args__ = (UniqueConstraint("session_id", "type_"),)
+
+
+class ArtifactMeta(Base):
+    """
+    Read-only view of 'Artifact' excluding the payload, for listing artifacts without transferring their bytes.
+    """
 
-    __table_args__ = (UniqueConstraint(session_id, type_),)
+    __table__ = Artifact.__table__
+    __mapper_args__ = {
+        "always_refresh": True,
+        "include_properties": ["id", "session_id", "type_", "backend", "storage", "hash_", "size"],
+    }
 
 
 class TrainingSession(BaseMixin, Base):
@@ -28,14 +66,72 @@ class TrainingSession(BaseMixin, Base):
     name = Column(String(255), nullable=False)
     version = Column(Integer(), nullable=False)
 
-    has_model = custom_column_property(column_property, "has_model")(
-        select([Artifact.id]).where((Artifact.session_id == id) & (Artifact.type_ == ArtifactType.Model)).as_scalar()
-        != None,
-        nullable=True,
-        default=False,
+    # NB: maintained by the listeners on 'Artifact' below, see 'backfill_has_model'
+    has_model = Column(Boolean(), nullable=True, default=False)
+
+    __table_args__ = (
+        UniqueConstraint(model_id, name, version),
+        Index("ix_TrainingSession_latest", model_id, name, has_model, id.desc()),
     )
 
-    __table_args__ = (UniqueConstraint(model_id, name, version),)
+
+def _set_has_model(connection, artifact: Artifact, value: bool):
+    if artifact.type_ != ArtifactType.Model:
+        return
+
+    table = TrainingSession.__table__
+    connection.execute(table.update().where(table.c.id == artifact.session_id).values(has_model=value))
+
+
+def _has_model_clause():
+    artifacts = Artifact.__table__
+    table = TrainingSession.__table__
+
+    return (
+        select(artifacts.c.id)
+        .where((artifacts.c.session_id == table.c.id) & (artifacts.c.type_ == ArtifactType.Model))
+        .exists()
+    )
+
+
+def backfill_has_model(connection, session_ids=None) -> int:
+    """
+    Recomputes 'TrainingSession.has_model' from the artifacts, for the sessions with 'session_ids' or all sessions if
+    not passed, returning the number of updated rows. The listeners below only fire for artifacts inserted, updated or
+    deleted through the ORM unit of work, i.e. 'session.add', 'session.delete' and flushed attribute changes. Writes
+    bypassing it, such as 'Session.bulk_save_objects', 'Session.bulk_insert_mappings' or Core and query level
+    'insert', 'update' and 'delete' statements, must be followed by a call to this function. It should also be run
+    once when adding the column to an existing database.
+    """
+
+    table = TrainingSession.__table__
+    statement = table.update().values(has_model=_has_model_clause())
+
+    if session_ids is not None:
+        statement = statement.where(table.c.id.in_(list(session_ids)))
+
+    return connection.execute(statement).rowcount
+
+
+@event.listens_for(Artifact, "after_insert")
+def _on_artifact_insert(mapper, connection, target: Artifact):
+    _set_has_model(connection, target, True)
+
+
+@event.listens_for(Artifact, "after_update")
+def _on_artifact_update(mapper, connection, target: Artifact):
+    state = inspect(target)
+    moved = state.attrs.session_id.history
+
+    if not (moved.has_changes() or state.attrs.type_.history.has_changes()):
+        return
+
+    backfill_has_model(connection, {target.session_id, *moved.deleted} - {None})
+
+
+@event.listens_for(Artifact, "after_delete")
+def _on_artifact_delete(mapper, connection, target: Artifact):
+    _set_has_model(connection, target, False)
 
 
 class UpdatedSession(BaseMixin, Base):
@@ -1,5 +1,5 @@
 from . import BaseMixin, Base
-from sqlalchemy import Column, String, DateTime, Integer, Enum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Integer, Enum, ForeignKey, Index
 from ..enums import Status
 from datetime import datetime
 from .exception import ExceptionTemplate
@@ -14,6 +14,8 @@ class Task(BaseMixin, Base):
 
     status = Column(Enum(Status, create_constraint=False, native_enum=False), nullable=False)
 
+    __table_args__ = (Index("ix_Task_status", status),)
+
 
 class TaskMeta(BaseMixin, Base):
     task_id = Column(Integer, ForeignKey(Task.id), nullable=False)
@@ -21,6 +23,8 @@ class TaskMeta(BaseMixin, Base):
     key = Column(String(100), nullable=False)
     value = Column(String(255), nullable=False)
 
+    __table_args__ = (Index("ix_TaskMeta_task_id_key", task_id, key),)
+
 
 class TaskException(ExceptionTemplate, Base):
     task_id = Column(Integer, ForeignKey(Task.id), nullable=False)
@@ -21,3 +21,14 @@ class Backend(Enum):
 class ArtifactType(Enum):
     Model = "Model"
     State = "State"
+
+
+class Storage(Enum):
+    Database = "Database"
+    Disk = "Disk"
+
+
+class Encoding(Enum):
+    Json = "Json"
+    Npy = "Npy"
+    Arrow = "Arrow"
@@ -1,5 +1,5 @@
-from .requests import PatchRequest, PutRequest, GetRequest, PostRequest
-from .responses import PatchResponse, PutResponse, GetResponse, PostResponse
+from .requests import PatchRequest, PutRequest, GetRequest, PostRequest, BeginSessionRequest, SESSION_ENDPOINT
+from .responses import PatchResponse, PutResponse, GetResponse, PostResponse, BeginSessionResponse
 
 
 __all__ = [
@@ -11,4 +11,7 @@ __all__ = [
     "GetResponse",
     "PatchRequest",
     "PatchResponse",
+    "BeginSessionRequest",
+    "BeginSessionResponse",
+    "SESSION_ENDPOINT",
 ]
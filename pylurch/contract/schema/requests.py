@@ -1,9 +1,12 @@
 from marshmallow import Schema, fields as f
+from marshmallow_enum import EnumField
+from ..enums import Encoding
 
 
 class FitParser(Schema):
     x = f.String(required=True)
-    orient = f.String(required=True)
+    orient = f.String(required=False, missing="columns")
+    encoding = EnumField(Encoding, required=False, missing=Encoding.Json)
     y = f.String(required=False)
     name = f.String(required=True)
 
@@ -16,6 +19,7 @@ class PutRequest(FitParser):
 
 class GetRequest(Schema):
     task_id = f.String(required=True)
+    encoding = EnumField(Encoding, required=False, missing=Encoding.Json)
 
 
 class PatchRequest(FitParser):
@@ -26,3 +30,13 @@ class PatchRequest(FitParser):
 class PostRequest(FitParser):
     as_array = f.Boolean(required=False, missing=False)
     kwargs = f.Dict(required=False, missing=dict())
+
+
+SESSION_ENDPOINT = "session/begin"
+
+
+class BeginSessionRequest(Schema):
+    model_name = f.String(required=False, allow_none=True)
+    model_revision = f.String(required=False, allow_none=True)
+    session_name = f.String(required=True)
+    old_session_id = f.Integer(required=False, allow_none=True)
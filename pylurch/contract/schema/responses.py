@@ -1,6 +1,6 @@
 from marshmallow import Schema, fields as f
 from marshmallow_enum import EnumField
-from ..enums import Status
+from ..enums import Status, Encoding
 
 
 class Base(Schema):
@@ -11,6 +11,7 @@ class Base(Schema):
 class GetResponse(Base):
     data = f.String(required=False)
     orient = f.String(required=False)
+    encoding = EnumField(Encoding, required=False, missing=Encoding.Json)
 
 
 class PutResponse(Base):
@@ -24,3 +25,10 @@ class PostResponse(Base):
 
 class PatchResponse(PutResponse):
     pass
+
+
+class BeginSessionResponse(Base):
+    id = f.Integer(required=False)
+    model_id = f.Integer(required=False)
+    name = f.String(required=False)
+    version = f.Integer(required=False)
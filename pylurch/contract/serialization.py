@@ -0,0 +1,101 @@
+import json
+from base64 import b64encode, b64decode
+from io import BytesIO, StringIO
+from typing import Union
+import numpy as np
+import pandas as pd
+from .enums import Encoding
+
+
+FrameOrArray = Union[pd.DataFrame, np.ndarray]
+
+_COLUMN_PREFIX = "column_"
+
+
+def _to_array(values: np.ndarray) -> np.ndarray:
+    # NB: object arrays would require pickling, so we store them as unicode instead
+    return values.astype(str) if values.dtype == object else values
+
+
+def _encode_npy(x: FrameOrArray) -> bytes:
+    buffer = BytesIO()
+
+    if isinstance(x, np.ndarray):
+        np.save(buffer, x, allow_pickle=False)
+        return buffer.getvalue()
+
+    columns = {f"{_COLUMN_PREFIX}{i}": _to_array(x.iloc[:, i].to_numpy()) for i in range(x.shape[1])}
+    names = np.array(json.dumps(x.columns.tolist(), default=str))
+    index_name = np.array(json.dumps(x.index.name, default=str))
+
+    np.savez(buffer, index=_to_array(x.index.to_numpy()), columns=names, index_name=index_name, **columns)
+
+    return buffer.getvalue()
+
+
+def _decode_npy(data: bytes) -> FrameOrArray:
+    loaded = np.load(BytesIO(data), allow_pickle=False)
+
+    if isinstance(loaded, np.ndarray):
+        return loaded
+
+    columns = json.loads(loaded["columns"].item())
+    values = {c: loaded[f"{_COLUMN_PREFIX}{i}"] for i, c in enumerate(columns)}
+
+    # NB: payloads encoded before the index name was included lack it
+    index_name = json.loads(loaded["index_name"].item()) if "index_name" in loaded.files else None
+
+    return pd.DataFrame(values, index=pd.Index(loaded["index"], name=index_name), columns=columns)
+
+
+def _encode_arrow(x: FrameOrArray) -> bytes:
+    import pyarrow as pa
+
+    if isinstance(x, np.ndarray):
+        x = pd.DataFrame(x)
+        x.columns = x.columns.astype(str)
+
+    table = pa.Table.from_pandas(x, preserve_index=True)
+    sink = pa.BufferOutputStream()
+
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return sink.getvalue().to_pybytes()
+
+
+def _decode_arrow(data: bytes) -> pd.DataFrame:
+    import pyarrow as pa
+
+    return pa.ipc.open_stream(pa.py_buffer(data)).read_all().to_pandas()
+
+
+def encode(x: FrameOrArray, encoding: Encoding = Encoding.Json, orient: str = "columns") -> str:
+    """
+    Encodes 'x' as a string suitable for the 'x', 'y' and 'data' fields of the schemas. Binary encodings are base64
+    encoded and, unlike JSON, preserve dtypes and index.
+    """
+
+    if encoding == Encoding.Json:
+        return (pd.DataFrame(x) if isinstance(x, np.ndarray) else x).to_json(orient=orient)
+
+    if encoding == Encoding.Npy:
+        return b64encode(_encode_npy(x)).decode("ascii")
+
+    if encoding == Encoding.Arrow:
+        return b64encode(_encode_arrow(x)).decode("ascii")
+
+    raise NotImplementedError(f"Encoding '{encoding}' is not supported!")
+
+
+def decode(data: str, encoding: Encoding = Encoding.Json, orient: str = "columns") -> FrameOrArray:
+    if encoding == Encoding.Json:
+        return pd.read_json(StringIO(data), orient=orient)
+
+    if encoding == Encoding.Npy:
+        return _decode_npy(b64decode(data))
+
+    if encoding == Encoding.Arrow:
+        return _decode_arrow(b64decode(data))
+
+    raise NotImplementedError(f"Encoding '{encoding}' is not supported!")
@@ -0,0 +1,2 @@
+from .base import ArtifactStore, hash_bytes
+from .disk import DiskArtifactStore
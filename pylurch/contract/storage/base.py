@@ -0,0 +1,37 @@
+from hashlib import sha256
+from typing import Union, Optional
+from ..enums import Storage
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def hash_bytes(data: Buffer) -> str:
+    return sha256(data).hexdigest()
+
+
+class ArtifactStore(object):
+    """
+    Base class for content-addressed artifact stores, i.e. stores where artifact bytes are keyed on their SHA-256.
+    """
+
+    backend = None  # type: Storage
+
+    def put(self, data: Buffer) -> str:
+        raise NotImplementedError()
+
+    def get(self, key: str) -> Buffer:
+        raise NotImplementedError()
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError()
+
+    def locate(self, key: str) -> Optional[str]:
+        """
+        Returns the path of a local file holding the artifact, if any, for consumers able to load from a path.
+        """
+
+        return None
+
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError()
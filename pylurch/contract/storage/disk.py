@@ -0,0 +1,115 @@
+import os
+import mmap
+import fcntl
+from contextlib import contextmanager
+from tempfile import NamedTemporaryFile
+from .base import ArtifactStore, Buffer, hash_bytes
+from ..enums import Storage
+
+
+class DiskArtifactStore(ArtifactStore):
+    backend = Storage.Disk
+
+    def __init__(self, directory: str):
+        """
+        Stores artifacts in a local directory keyed on their SHA-256, loading them as read-only memory maps. Identical
+        artifacts are only stored once, and are reference counted such that the content is only removed once deleted
+        as many times as it was put. Do note that counting relies on POSIX file locks.
+        """
+
+        self._directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], key)
+
+    @contextmanager
+    def _locked(self, path: str):
+        folder = os.path.dirname(path)
+        os.makedirs(folder, exist_ok=True)
+
+        # NB: the lock file is shared by all keys of the folder and never removed, so waiting writers cannot end up
+        # holding a lock on a removed file
+        with open(os.path.join(folder, ".lock"), "a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _read_refs(path: str) -> int:
+        try:
+            with open(f"{path}.refs", "r") as f:
+                return int(f.read() or 0)
+        except FileNotFoundError:
+            # NB: content stored before reference counting was introduced counts as one reference
+            return 1 if os.path.exists(path) else 0
+
+    @staticmethod
+    def _write_refs(path: str, refs: int):
+        with open(f"{path}.refs", "w") as f:
+            f.write(str(refs))
+
+    def put(self, data: Buffer) -> str:
+        key = hash_bytes(data)
+        path = self.path(key)
+
+        with self._locked(path):
+            refs = self._read_refs(path)
+
+            if refs == 0:
+                with NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as f:
+                    f.write(data)
+
+                os.replace(f.name, path)
+
+            self._write_refs(path, refs + 1)
+
+        return key
+
+    def get(self, key: str) -> Buffer:
+        path = self.path(key)
+
+        if os.path.getsize(path) == 0:
+            return b""
+
+        with open(path, "rb") as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def locate(self, key):
+        path = self.path(key)
+        return path if os.path.exists(path) else None
+
+    def references(self, key: str) -> int:
+        path = self.path(key)
+
+        with self._locked(path):
+            return self._read_refs(path)
+
+    def delete(self, key: str) -> bool:
+        """
+        Drops one reference to the artifact, removing the content once no references remain. Returns whether the
+        content was removed.
+        """
+
+        path = self.path(key)
+
+        with self._locked(path):
+            refs = self._read_refs(path)
+
+            if refs > 1:
+                self._write_refs(path, refs - 1)
+                return False
+
+            for p in (path, f"{path}.refs"):
+                try:
+                    os.remove(p)
+                except FileNotFoundError:
+                    pass
+
+            return refs == 1
@@ -1,3 +1,9 @@
 from .blueprint import InferenceModelBlueprint
 from .container import InferenceContainer, LoadedContainer
 from .sessionmanager import SessionManager
+from .cache import ModelCache
+from .batching import MicroBatcher
+from .onnx import OnnxOptions, InferenceSessionPool
+from .streaming import iter_chunks, ChunkWriter, run_stream_prediction
+from .parallel import ShardedPredictor
+from .results import PredictionCache
@@ -0,0 +1,150 @@
+from concurrent.futures import Future
+from queue import Queue, Empty
+from threading import Thread, Lock
+from time import perf_counter
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+from .blueprint import InferenceModelBlueprint
+from .container import LoadedContainer
+from .metrics import Histogram
+from .types import FrameOrArray
+
+
+_Request = Tuple[FrameOrArray, Future, float]
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+QUEUE_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+class MicroBatcher(object):
+    def __init__(
+        self,
+        blueprint: InferenceModelBlueprint,
+        container: LoadedContainer,
+        max_batch_size: int = 256,
+        max_wait: float = 0.005,
+    ):
+        """
+        Merges concurrent prediction requests against the same loaded container into one call to
+        'InferenceModelBlueprint.predict', waiting at most 'max_wait' seconds or until 'max_batch_size' rows are
+        queued, and splits the output back to each caller.
+        """
+
+        self._blueprint = blueprint
+        self._container = container
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+
+        self._queue = Queue()
+        self._thread = None  # type: Thread
+        self._lock = Lock()
+        self._closed = False
+
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_waits = Histogram(QUEUE_WAIT_BUCKETS)
+
+    @property
+    def container(self) -> LoadedContainer:
+        return self._container
+
+    def _submit(self, x: FrameOrArray) -> Future:
+        with self._lock:
+            if self._closed:
+                return None
+
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+            future = Future()
+            self._queue.put((x, future, perf_counter()))
+
+            return future
+
+    def predict(self, x: FrameOrArray, **kwargs) -> FrameOrArray:
+        future = self._submit(x) if not kwargs else None
+
+        if future is None:
+            return self._blueprint.predict(self._container, x, **kwargs)
+
+        return future.result()
+
+    def _collect(self, first: _Request) -> Tuple[List[_Request], bool]:
+        batch = [first]
+        rows = len(first[0])
+        deadline = first[2] + self._max_wait
+
+        while rows < self._max_batch_size:
+            timeout = deadline - perf_counter()
+
+            if timeout <= 0.0:
+                break
+
+            try:
+                item = self._queue.get(timeout=timeout)
+            except Empty:
+                break
+
+            if item is None:
+                return batch, True
+
+            batch.append(item)
+            rows += len(item[0])
+
+        return batch, False
+
+    def _run(self):
+        for item in iter(self._queue.get, None):
+            batch, stop = self._collect(item)
+
+            frames = [b for b in batch if isinstance(b[0], pd.DataFrame)]
+            arrays = [b for b in batch if not isinstance(b[0], pd.DataFrame)]
+
+            for group in (frames, arrays):
+                if group:
+                    self._process(group)
+
+            if stop:
+                return
+
+    def _process(self, batch: List[_Request]):
+        now = perf_counter()
+        for _, _, enqueued in batch:
+            self.queue_waits.observe(now - enqueued)
+
+        inputs = [b[0] for b in batch]
+        self.batch_sizes.observe(sum(len(x) for x in inputs))
+
+        try:
+            if len(inputs) == 1:
+                merged = inputs[0]
+            elif isinstance(inputs[0], pd.DataFrame):
+                merged = pd.concat(inputs, axis=0)
+            else:
+                merged = np.concatenate(inputs, axis=0)
+
+            result = self._blueprint.predict(self._container, merged)
+        except Exception as exc:
+            for _, future, _ in batch:
+                future.set_exception(exc)
+
+            return
+
+        offset = 0
+        for x, future, _ in batch:
+            end = offset + len(x)
+            future.set_result(result.iloc[offset:end] if isinstance(result, pd.DataFrame) else result[offset:end])
+            offset = end
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            thread, self._thread = self._thread, None
+
+            if thread is None:
+                return
+
+            self._queue.put(None)
+
+        thread.join()
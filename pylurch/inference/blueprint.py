@@ -1,18 +1,51 @@
 import pandas as pd
-from typing import Dict, Tuple, Any, Generic, TypeVar
+from typing import Dict, Tuple, Any, Generic, TypeVar, Optional
 import numpy as np
 import git
 from pylurch.contract import database as db, enums
 from .container import InferenceContainer, LoadedContainer, TModel
 from .types import FrameOrArray
+from .onnx import OnnxOptions, ModelSource, InferenceSessionPool
 
 
 TOutput = TypeVar("TOutput")
 T = InferenceContainer[TModel]
 U = LoadedContainer[TOutput]
 
+ONNX_TYPES = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+    "tensor(bool)": np.bool_,
+}
+
+
+def to_input_array(x: FrameOrArray, dtype=np.float32) -> np.ndarray:
+    """
+    Returns 'x' as a C-contiguous array of 'dtype', only copying if the data does not already have that layout.
+    """
+
+    values = x.to_numpy() if isinstance(x, pd.DataFrame) else x
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def _is_bindable(out: np.ndarray, dtype) -> bool:
+    # NB: ONNX Runtime writes to the raw buffer of bound outputs, which must thus match its layout exactly
+    return out.flags.c_contiguous and out.flags.writeable and (out.dtype == dtype)
+
 
 class InferenceModelBlueprint(Generic[TModel, TOutput]):
+    def __init__(self, onnx_options: OnnxOptions = None):
+        self._onnx_options = onnx_options or OnnxOptions()
+
+    @property
+    def onnx_options(self) -> OnnxOptions:
+        return self._onnx_options
+
+    def make_onnx_session(self, model: ModelSource):
+        return self._onnx_options.make_session(model)
+
     def get_revision(self):
         repo = git.Repo(search_parent_directories=True)
         return repo.head.object.hexsha
@@ -28,6 +61,9 @@ class InferenceModelBlueprint(Generic[TModel, TOutput]):
     ) -> Tuple[db.Artifact, ...]:
         raise NotImplementedError()
 
+    def prediction_artifacts(self) -> Tuple[enums.ArtifactType, ...]:
+        return (enums.ArtifactType.Model,)
+
     def deserialize(self, artifacts: Tuple[db.Artifact, ...]) -> U:
         raise NotImplementedError()
 
@@ -37,16 +73,69 @@ class InferenceModelBlueprint(Generic[TModel, TOutput]):
     def update(self, container: U, x: FrameOrArray, y: FrameOrArray = None, **kwargs: Dict[str, object]):
         raise ValueError()
 
-    def predict(self, container: U, x: FrameOrArray, **kwargs: Dict[str, object]) -> FrameOrArray:
+    def make_warmup_batch(self, container: U, batch_size: int = 1) -> Optional[FrameOrArray]:
+        """
+        Returns a synthetic batch of 'batch_size' rows used for warming up the model, or None if the model should not be
+        warmed up. Defaults to zeros shaped after the first input of ONNX models, override for other backends or for
+        models sensitive to the values.
+        """
+
+        if container.backend != enums.Backend.ONNX:
+            return None
+
+        inp = container.model.get_inputs()[0]
+        shape = [d if isinstance(d, int) else 1 for d in inp.shape]
+
+        if shape:
+            shape[0] = batch_size
+
+        return np.zeros(shape, dtype=ONNX_TYPES.get(inp.type, np.float32))
+
+    def warm_up(self, container: U, batch_size: int = 1) -> bool:
+        """
+        Runs a synthetic batch through the model so that lazy initialization and first run optimizations are done
+        before serving. Returns whether the model was warmed up.
+        """
+
+        x = self.make_warmup_batch(container, batch_size)
+
+        if x is None:
+            return False
+
+        # NB: sessions of a pool are handed out in turn, so this runs the batch once through each of them
+        runs = container.model.size if isinstance(container.model, InferenceSessionPool) else 1
+
+        for _ in range(runs):
+            self.predict(container, x)
+
+        return True
+
+    def predict(
+        self, container: U, x: FrameOrArray, out: np.ndarray = None, **kwargs: Dict[str, object]
+    ) -> FrameOrArray:
         if container.backend != enums.Backend.ONNX:
             raise NotImplementedError(f"Backend must be of type of {enums.Backend.ONNX}, not {container.backend}")
 
         inp_name = container.model.get_inputs()[0].name
-        label_name = container.model.get_outputs()[0].name
+        output = container.model.get_outputs()[0]
+        label_name = output.name
+
+        values = to_input_array(x)
+
+        if out is None:
+            res = container.model.run([label_name], {inp_name: values})[0]
+        elif hasattr(container.model, "io_binding") and _is_bindable(out, ONNX_TYPES.get(output.type)):
+            binding = container.model.io_binding()
+            binding.bind_cpu_input(inp_name, values)
+            binding.bind_output(label_name, "cpu", 0, out.dtype.type, out.shape, out.ctypes.data)
 
-        res = container.model.run([label_name], {inp_name: x.values.astype(np.float32)})[0]
+            container.model.run_with_iobinding(binding)
+            res = out
+        else:
+            res = out
+            np.copyto(out, container.model.run([label_name], {inp_name: values})[0])
 
         if isinstance(x, pd.DataFrame):
-            return pd.DataFrame(res, index=x.index, columns=["y"])
+            return pd.DataFrame(res.reshape(len(x), -1), index=x.index, columns=["y"], copy=False)
 
         return res
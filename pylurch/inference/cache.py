@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Hashable, Tuple, Dict, Optional, List
+from .container import LoadedContainer
+
+
+class ModelCache(object):
+    def __init__(self, max_entries: int = 16, max_bytes: Optional[int] = None):
+        """
+        LRU cache of deserialized models keyed on training session, bounded by number of entries and by total size of
+        the artifacts the models were loaded from. Concurrent loads of the same key are collapsed into one.
+        """
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._entries = OrderedDict()  # type: OrderedDict[Hashable, Tuple[LoadedContainer, int]]
+        self._loading = dict()  # type: Dict[Hashable, Future]
+        self._lock = Lock()
+        self._listeners = list()  # type: List[Callable[[Hashable, LoadedContainer], None]]
+
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def add_eviction_listener(self, f: Callable[[Hashable, LoadedContainer], None]):
+        """
+        Registers 'f' to be called with the key and container of every model leaving the cache, be it evicted,
+        replaced, invalidated, cleared or too large to be cached in the first place. Listeners are called outside of
+        the cache's lock.
+        """
+
+        self._listeners.append(f)
+
+    def _notify(self, removed: List[Tuple[Hashable, LoadedContainer]]):
+        for key, container in removed:
+            for f in self._listeners:
+                f(key, container)
+
+    def get(self, key: Hashable) -> Optional[LoadedContainer]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def get_or_load(self, key: Hashable, f: Callable[[], Tuple[LoadedContainer, int]]) -> LoadedContainer:
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+
+                return self._entries[key][0]
+
+            future = self._loading.get(key)
+            owner = future is None
+
+            if owner:
+                self._misses += 1
+                future = self._loading[key] = Future()
+            else:
+                self._hits += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            container, nbytes = f()
+        except Exception as exc:
+            with self._lock:
+                self._loading.pop(key, None)
+
+            future.set_exception(exc)
+            raise exc
+
+        with self._lock:
+            self._loading.pop(key, None)
+            removed = self._put(key, container, nbytes)
+
+        future.set_result(container)
+        self._notify(removed)
+
+        return container
+
+    def _put(self, key: Hashable, container: LoadedContainer, nbytes: int) -> List[Tuple[Hashable, LoadedContainer]]:
+        if (self._max_bytes is not None) and (nbytes > self._max_bytes):
+            return [(key, container)]
+
+        removed = list()
+
+        if key in self._entries:
+            replaced, replaced_bytes = self._entries.pop(key)
+            self._bytes -= replaced_bytes
+            removed.append((key, replaced))
+
+        self._entries[key] = (container, nbytes)
+        self._bytes += nbytes
+
+        while (len(self._entries) > self._max_entries) or (
+            (self._max_bytes is not None) and (self._bytes > self._max_bytes)
+        ):
+            evicted_key, (evicted, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+            self._evictions += 1
+
+            removed.append((evicted_key, evicted))
+
+        return removed
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            if key not in self._entries:
+                return False
+
+            container, nbytes = self._entries.pop(key)
+            self._bytes -= nbytes
+
+        self._notify([(key, container)])
+
+        return True
+
+    def clear(self):
+        with self._lock:
+            removed = [(k, c) for k, (c, _) in self._entries.items()]
+
+            self._entries.clear()
+            self._bytes = 0
+
+        self._notify(removed)
@@ -14,6 +14,7 @@ class InferenceContainer(Generic[TModel]):
 
 
 class LoadedContainer(InferenceContainer[TModel]):
-    def __init__(self, model: TModel, backend: Backend):
+    def __init__(self, model: TModel, backend: Backend, fingerprint: str = None):
         super().__init__(model)
         self.backend = backend
+        self.fingerprint = fingerprint
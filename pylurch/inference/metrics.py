@@ -0,0 +1,40 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Sequence, Dict, Any
+
+
+class Histogram(object):
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Minimal thread safe histogram with fixed upper bucket bounds, the last bucket catching everything above.
+        """
+
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = Lock()
+
+    def observe(self, value: float):
+        with self._lock:
+            self._counts[bisect_left(self._buckets, value)] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            bounds = self._buckets + (float("inf"),)
+
+            return {
+                "buckets": dict(zip(bounds, self._counts)),
+                "sum": self._sum,
+                "count": self._count,
+            }
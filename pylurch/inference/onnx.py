@@ -0,0 +1,102 @@
+import os
+from queue import Queue
+from typing import Union, Optional, Sequence, Dict, Any
+import onnxruntime as rt
+
+
+ModelSource = Union[bytes, str]
+
+
+def default_thread_budget() -> int:
+    """
+    Number of cores available to this worker, taking into account the number of web workers sharing the host as
+    given by the 'WEB_CONCURRENCY' environment variable.
+    """
+
+    workers = max(int(os.environ.get("WEB_CONCURRENCY", 1)), 1)
+    return max((os.cpu_count() or 1) // workers, 1)
+
+
+class OnnxOptions(object):
+    def __init__(
+        self,
+        intra_op_num_threads: Optional[int] = None,
+        inter_op_num_threads: Optional[int] = None,
+        graph_optimization_level: rt.GraphOptimizationLevel = rt.GraphOptimizationLevel.ORT_ENABLE_ALL,
+        execution_mode: rt.ExecutionMode = rt.ExecutionMode.ORT_SEQUENTIAL,
+        pool_size: int = 1,
+        thread_budget: Optional[int] = None,
+        providers: Sequence[str] = None,
+    ):
+        """
+        Configuration of ONNX Runtime inference sessions. If 'pool_size' is larger than one, that many sessions are
+        created per model. Unless 'intra_op_num_threads' is set, 'thread_budget' cores are split evenly between them,
+        which defaults to the cores of the host divided by the number of web workers, see 'default_thread_budget'.
+        """
+
+        self.intra_op_num_threads = intra_op_num_threads
+        self.inter_op_num_threads = inter_op_num_threads
+        self.graph_optimization_level = graph_optimization_level
+        self.execution_mode = execution_mode
+        self.pool_size = max(pool_size, 1)
+        self.thread_budget = thread_budget
+        self.providers = providers
+
+    def make_session_options(self) -> rt.SessionOptions:
+        options = rt.SessionOptions()
+        options.graph_optimization_level = self.graph_optimization_level
+        options.execution_mode = self.execution_mode
+
+        # NB: unless set explicitly, the cores of this worker are always split between the sessions of the pool
+        intra_op = self.intra_op_num_threads
+        if intra_op is None:
+            intra_op = max((self.thread_budget or default_thread_budget()) // self.pool_size, 1)
+
+        options.intra_op_num_threads = intra_op
+
+        if self.inter_op_num_threads is not None:
+            options.inter_op_num_threads = self.inter_op_num_threads
+
+        return options
+
+    def make_session(self, model: ModelSource) -> Union[rt.InferenceSession, "InferenceSessionPool"]:
+        if self.pool_size > 1:
+            return InferenceSessionPool(model, self)
+
+        return rt.InferenceSession(model, self.make_session_options(), providers=self.providers)
+
+
+class InferenceSessionPool(object):
+    def __init__(self, model: ModelSource, options: OnnxOptions):
+        """
+        Pool of identical inference sessions, each using its share of the thread budget. Exposes the subset of the
+        'onnxruntime.InferenceSession' interface used for predicting, so that it may be used in its place.
+        """
+
+        session_options = options.make_session_options()
+
+        self._sessions = [
+            rt.InferenceSession(model, session_options, providers=options.providers) for _ in range(options.pool_size)
+        ]
+
+        self._available = Queue()
+        for s in self._sessions:
+            self._available.put(s)
+
+    @property
+    def size(self) -> int:
+        return len(self._sessions)
+
+    def get_inputs(self):
+        return self._sessions[0].get_inputs()
+
+    def get_outputs(self):
+        return self._sessions[0].get_outputs()
+
+    def run(self, output_names, input_feed: Dict[str, Any], run_options=None):
+        session = self._available.get()
+
+        try:
+            return session.run(output_names, input_feed, run_options)
+        finally:
+            self._available.put(session)
@@ -0,0 +1,83 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Sequence, Tuple, List
+import numpy as np
+import pandas as pd
+from pylurch.contract import database as db
+from .blueprint import InferenceModelBlueprint
+from .container import LoadedContainer
+from .types import FrameOrArray
+
+_WORKER = dict()
+
+
+def _initialize_worker(blueprint: InferenceModelBlueprint, artifacts: Sequence[Tuple]):
+    loaded = tuple(db.Artifact(type_=t, backend=b, bytes=v) for (t, b, v) in artifacts)
+
+    _WORKER["blueprint"] = blueprint
+    _WORKER["container"] = blueprint.deserialize(loaded)
+
+
+def _predict_shard(name: str, shape: Tuple[int, ...], dtype: str, start: int, end: int, kwargs) -> FrameOrArray:
+    shm = shared_memory.SharedMemory(name=name)
+    x = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)[start:end]
+
+    try:
+        return _WORKER["blueprint"].predict(_WORKER["container"], x, **kwargs)
+    finally:
+        # NB: the view must be released before the shared memory can be closed
+        del x
+        shm.close()
+
+
+class ShardedPredictor(object):
+    def __init__(self, blueprint: InferenceModelBlueprint, artifacts: Sequence[db.Artifact], processes: int = None):
+        """
+        Scores large inputs by splitting them into shards that are predicted in a pool of processes. Each process
+        loads the model once at start up, and inputs are shared with the processes via shared memory.
+        """
+
+        payload = tuple((a.type_, a.backend, bytes(a.bytes)) for a in artifacts)
+
+        self._processes = processes or os.cpu_count()
+        self._executor = ProcessPoolExecutor(
+            self._processes, initializer=_initialize_worker, initargs=(blueprint, payload)
+        )
+
+    def predict(self, x: FrameOrArray, shards: int = None, **kwargs) -> FrameOrArray:
+        values = np.ascontiguousarray(x.to_numpy() if isinstance(x, pd.DataFrame) else x)
+        shards = max(min(shards or self._processes, len(values)), 1)
+
+        shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+
+        try:
+            np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)[:] = values
+
+            bounds = np.linspace(0, len(values), shards + 1).astype(int)
+            futures = [
+                self._executor.submit(_predict_shard, shm.name, values.shape, values.dtype.str, start, end, kwargs)
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+
+            results = [f.result() for f in futures]  # type: List[FrameOrArray]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        result = np.concatenate(results, axis=0)
+
+        if isinstance(x, pd.DataFrame):
+            return pd.DataFrame(result.reshape(len(x), -1), index=x.index, columns=["y"], copy=False)
+
+        return result
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
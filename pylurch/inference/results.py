@@ -0,0 +1,102 @@
+from hashlib import sha256
+from threading import Lock
+from typing import Callable, Hashable, Sequence, Dict, Any
+import numpy as np
+import pandas as pd
+from cachetools import TTLCache
+from pylurch.contract import database as db
+from pylurch.contract.storage import hash_bytes
+from .types import FrameOrArray
+
+
+def fingerprint(artifacts: Sequence[db.Artifact]) -> str:
+    """
+    Identifies the model defined by 'artifacts', changing whenever any of the artifacts do.
+    """
+
+    hashes = sorted(f"{a.type_}:{a.hash_ or hash_bytes(a.bytes)}" for a in artifacts)
+    return sha256("|".join(hashes).encode()).hexdigest()
+
+
+def hash_rows(x: FrameOrArray) -> np.ndarray:
+    frame = pd.DataFrame(x) if isinstance(x, np.ndarray) else x
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+class PredictionCache(object):
+    def __init__(self, maxsize: int = 1_000_000, ttl: float = 60 * 60):
+        """
+        Caches predictions per row, keyed on session, model fingerprint and a hash of the row, so that only rows not
+        seen before are predicted. Entries expire after 'ttl' seconds and the least recently used rows are evicted
+        once 'maxsize' rows are cached.
+        """
+
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self._hits + self._misses
+
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total > 0 else 0.0,
+                "rows": len(self._cache),
+            }
+
+    def predict(
+        self, session_id: int, token: Hashable, x: FrameOrArray, f: Callable[[FrameOrArray], FrameOrArray]
+    ) -> FrameOrArray:
+        hashes = hash_rows(x)
+        keys = [(session_id, token, h) for h in hashes]
+
+        with self._lock:
+            cached = [self._cache.get(k) for k in keys]
+
+        missing = np.array([c is None for c in cached], dtype=bool)
+        n_missing = int(missing.sum())
+
+        if n_missing > 0:
+            computed = f(x[missing] if isinstance(x, np.ndarray) else x.loc[missing])
+
+            columns = tuple(computed.columns) if isinstance(computed, pd.DataFrame) else None
+            values = computed.to_numpy() if isinstance(computed, pd.DataFrame) else np.asarray(computed)
+
+            missing_index = np.flatnonzero(missing)
+
+            with self._lock:
+                for i, row in zip(missing_index, values):
+                    cached[i] = entry = (row, columns)
+                    self._cache[keys[i]] = entry
+
+        with self._lock:
+            self._hits += len(keys) - n_missing
+            self._misses += n_missing
+
+        if not cached:
+            return f(x)
+
+        result = np.stack([c[0] for c in cached])
+        columns = cached[0][1]
+
+        if isinstance(x, pd.DataFrame) and (columns is not None):
+            return pd.DataFrame(result, index=x.index, columns=list(columns), copy=False)
+
+        return result
+
+    def invalidate(self, session_id: int) -> int:
+        with self._lock:
+            keys = [k for k in self._cache.keys() if k[0] == session_id]
+
+            for k in keys:
+                self._cache.pop(k, None)
+
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
@@ -1,18 +1,79 @@
+from typing import Callable, Iterator, Optional
 from .base import Session
+from ..batching import MicroBatcher
+from ..cache import ModelCache
+from ..container import LoadedContainer
+from ..parallel import ShardedPredictor
+from ..results import PredictionCache, fingerprint
+from ..streaming import Source, ChunkWriter, stream_predict
 from ..types import FrameOrArray
 
 
 class PredictionSession(Session):
-    def __init__(self, context, blueprint):
+    def __init__(
+        self,
+        context,
+        blueprint,
+        cache: ModelCache = None,
+        batcher: Callable[[int, LoadedContainer], Optional[MicroBatcher]] = None,
+        result_cache: PredictionCache = None,
+    ):
         super().__init__(context, blueprint)
+        self._cache = cache
+        self._result_cache = result_cache
         self._container = self._load()
+        self._batcher = batcher(context.session.id, self._container) if batcher is not None else None
+
+    def _deserialize(self):
+        artifacts = self._get_artifacts()
+
+        container = self._blueprint.deserialize(artifacts)
+        container.fingerprint = fingerprint(artifacts)
+
+        return container, sum(len(a.bytes) for a in artifacts)
+
+    def _get_artifacts(self):
+        result = self.context.get_result(types=self._blueprint.prediction_artifacts())
+        return result if isinstance(result, (list, tuple)) else [result]
 
     def _load(self):
-        result = self.context.get_result()
-        return self._blueprint.deserialize(result)
+        if self._cache is None:
+            return self._deserialize()[0]
+
+        return self._cache.get_or_load(self.context.session.id, self._deserialize)
 
     def _on_exit(self):
         self._container = None
+        self._batcher = None
+
+    def warm_up(self, batch_size: int = 1) -> bool:
+        return self._blueprint.warm_up(self._container, batch_size)
 
     def predict(self, x: FrameOrArray, **kwargs):
+        if (self._result_cache is not None) and not kwargs:
+            return self._result_cache.predict(self.context.session.id, self._container.fingerprint, x, self._predict)
+
+        return self._predict(x, **kwargs)
+
+    def _predict(self, x: FrameOrArray, **kwargs):
+        if self._batcher is not None:
+            return self._batcher.predict(x, **kwargs)
+
         return self._blueprint.predict(self._container, x, **kwargs)
+
+    def predict_stream(self, source: Source, chunksize: int = 10_000, **kwargs) -> Iterator[FrameOrArray]:
+        return stream_predict(lambda u: self.predict(u, **kwargs), source, chunksize)
+
+    def predict_to(self, source: Source, destination: str, chunksize: int = 10_000, **kwargs) -> int:
+        with ChunkWriter(destination) as writer:
+            for chunk in self.predict_stream(source, chunksize=chunksize, **kwargs):
+                writer.write(chunk)
+
+        return writer.rows
+
+    def make_sharded_predictor(self, processes: int = None) -> ShardedPredictor:
+        return ShardedPredictor(self._blueprint, self._get_artifacts(), processes=processes)
+
+    def predict_sharded(self, x: FrameOrArray, processes: int = None, shards: int = None, **kwargs) -> FrameOrArray:
+        with self.make_sharded_predictor(processes) as predictor:
+            return predictor.predict(x, shards=shards, **kwargs)
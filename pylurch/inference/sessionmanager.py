@@ -1,13 +1,94 @@
+from typing import Dict, Any, Sequence, Optional
+from threading import Lock
+from time import perf_counter
+from logging import Logger
+from pyalfred.server.utils import make_base_logger
 from pylurch.contract.client import SessionClient
 from .blueprint import InferenceModelBlueprint, TModel, TOutput
 from .session import TrainingSession, PredictionSession, UpdateSession
+from .cache import ModelCache
+from .batching import MicroBatcher
+from .container import LoadedContainer
+from .results import PredictionCache
+from .streaming import Source, run_stream_prediction
 
 
 # TODO: Should this be context as well...?
 class SessionManager(object):
-    def __init__(self, client: SessionClient, blueprint: InferenceModelBlueprint[TModel, TOutput]):
+    def __init__(
+        self,
+        client: SessionClient,
+        blueprint: InferenceModelBlueprint[TModel, TOutput],
+        cache: ModelCache = None,
+        batching: Dict[str, Any] = None,
+        result_cache: PredictionCache = None,
+        logger: Logger = None,
+    ):
+        """
+        Manages sessions of 'blueprint'. As requests are batched per loaded model, 'batching' requires a 'cache' so
+        that concurrent prediction sessions share the same model. Batchers are closed once their model leaves the
+        cache, and models not kept by the cache are not batched.
+        """
+
+        if (batching is not None) and (cache is None):
+            raise ValueError("Batching requires a 'cache' to be passed!")
+
         self._client = client
         self._blueprint = blueprint
+        self._cache = cache
+        self._result_cache = result_cache
+
+        self._batching = batching
+        self._batchers = dict()  # type: Dict[int, MicroBatcher]
+        self._lock = Lock()
+
+        self._logger = logger or make_base_logger(self.__class__.__name__)
+
+        if batching is not None:
+            cache.add_eviction_listener(self._drop_batcher)
+
+    @property
+    def cache(self) -> ModelCache:
+        return self._cache
+
+    @property
+    def result_cache(self) -> PredictionCache:
+        return self._result_cache
+
+    @property
+    def batchers(self) -> Dict[int, MicroBatcher]:
+        return self._batchers
+
+    def _get_batcher(self, session_id: int, container: LoadedContainer) -> Optional[MicroBatcher]:
+        stale = None
+
+        with self._lock:
+            # NB: the batcher is dropped together with the container, which must thus be in the cache to be batched
+            if self._cache.get(session_id) is not container:
+                return None
+
+            batcher = self._batchers.get(session_id)
+
+            if (batcher is None) or (batcher.container is not container):
+                stale = batcher
+                batcher = self._batchers[session_id] = MicroBatcher(self._blueprint, container, **self._batching)
+
+        # NB: closing joins the batching thread, which may be busy predicting, and so is done outside of the lock
+        if stale is not None:
+            stale.close()
+
+        return batcher
+
+    def _drop_batcher(self, session_id: int, container: LoadedContainer):
+        with self._lock:
+            batcher = self._batchers.get(session_id)
+
+            if (batcher is None) or (batcher.container is not container):
+                return
+
+            del self._batchers[session_id]
+
+        batcher.close()
 
     def begin_training_session(self, session_name: str, **kwargs):
         context = self._client.begin_training_session(
@@ -19,7 +100,76 @@ class SessionManager(object):
     def begin_prediction_session(self, session_id: int):
         context = self._client.begin_prediction_session(session_id)
 
-        return PredictionSession(context, self._blueprint)
+        batcher = self._get_batcher if self._batching is not None else None
+
+        return PredictionSession(
+            context, self._blueprint, cache=self._cache, batcher=batcher, result_cache=self._result_cache
+        )
+
+    def warm_up(
+        self, session_ids: Sequence[int] = (), session_names: Sequence[str] = (), batch_size: int = 1
+    ) -> Dict[int, Dict[str, float]]:
+        """
+        Preloads the sessions with 'session_ids', as well as the latest successful session of each of 'session_names'
+        for the current revision of the blueprint, and runs a synthetic batch through each. Intended to be run at
+        startup, e.g. as an 'on_startup' handler of the application, before the worker reports ready. Returns the
+        seconds spent loading and on the first prediction per session. Do note that without a 'cache', the loaded
+        models are not kept.
+        """
+
+        if self._cache is None:
+            self._logger.warning("No model cache configured, models will be reloaded on first use")
+
+        name = self._blueprint.name()
+        ids = list(session_ids)
+
+        for session_name in session_names:
+            session = self._client.get_session(name, self._blueprint.get_revision(), session_name, only_succeeded=True)
+
+            if session is None:
+                self._logger.warning(f"No successful session '{session_name}' exists for '{name}', skipping warm up")
+                continue
+
+            ids.append(session.id)
+
+        timings = dict()
+
+        for session_id in dict.fromkeys(ids):
+            try:
+                start = perf_counter()
+                session = self.begin_prediction_session(session_id)
+                loaded = perf_counter()
+
+                try:
+                    session.warm_up(batch_size)
+                finally:
+                    session.__exit__(None, None, None)
+
+                timings[session_id] = {"load": loaded - start, "predict": perf_counter() - loaded}
+            except Exception as exc:
+                self._logger.exception(exc)
+                continue
+
+            self._logger.info(
+                f"Warmed up session {session_id} of '{name}': loaded in {timings[session_id]['load']:.3f}s, first "
+                f"prediction in {timings[session_id]['predict']:.3f}s"
+            )
+
+        return timings
+
+    def enqueue_stream_prediction(
+        self, runner, session_id: int, source: Source, destination: str, chunksize: int = 10_000, **kwargs
+    ) -> str:
+        return runner.enqueue(
+            run_stream_prediction,
+            self._client,
+            self._blueprint,
+            session_id,
+            source,
+            destination,
+            chunksize=chunksize,
+            **kwargs,
+        )
 
     def begin_update_session(self, new_session_name: str, old_session_id: int):
         context = self._client.begin_update_session(new_session_name, old_session_id)
@@ -0,0 +1,139 @@
+import os
+from typing import Iterable, Iterator, Union, Callable
+import numpy as np
+import pandas as pd
+from .types import FrameOrArray
+
+
+Source = Union[str, FrameOrArray, Iterable[FrameOrArray]]
+
+
+def _extension(path: str) -> str:
+    return os.path.splitext(path)[-1].lower()
+
+
+def iter_chunks(source: Source, chunksize: int = 10_000) -> Iterator[FrameOrArray]:
+    """
+    Iterates over 'source' in chunks of at most 'chunksize' rows. 'source' may be a path to a CSV, Parquet or npy file,
+    an in-memory frame or array, or an iterable of frames or arrays, which are yielded as is.
+    """
+
+    if isinstance(source, (pd.DataFrame, np.ndarray)):
+        for i in range(0, len(source), chunksize):
+            yield source.iloc[i : i + chunksize] if isinstance(source, pd.DataFrame) else source[i : i + chunksize]
+
+        return
+
+    if not isinstance(source, str):
+        yield from source
+        return
+
+    extension = _extension(source)
+
+    if extension == ".csv":
+        with pd.read_csv(source, chunksize=chunksize) as reader:
+            yield from reader
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    elif extension == ".npy":
+        yield from iter_chunks(np.load(source, mmap_mode="r"), chunksize)
+    else:
+        raise NotImplementedError(f"Files of type '{extension}' are not supported!")
+
+
+class ChunkWriter(object):
+    def __init__(self, path: str):
+        """
+        Writes prediction chunks incrementally to a CSV or Parquet file.
+        """
+
+        self._path = path
+        self._extension = _extension(path)
+        self._writer = None
+        self._rows = 0
+
+        if self._extension not in (".csv", ".parquet"):
+            raise NotImplementedError(f"Files of type '{self._extension}' are not supported!")
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    def write(self, chunk: FrameOrArray):
+        frame = pd.DataFrame(chunk) if isinstance(chunk, np.ndarray) else chunk
+        frame.columns = frame.columns.astype(str)
+
+        if self._extension == ".csv":
+            frame.to_csv(self._path, mode="w" if self._rows == 0 else "a", header=self._rows == 0)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=True)
+
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self._path, table.schema)
+
+            self._writer.write_table(table)
+
+        self._rows += len(frame)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def stream_predict(
+    predict: Callable[[FrameOrArray], FrameOrArray], source: Source, chunksize: int = 10_000
+) -> Iterator[FrameOrArray]:
+    for chunk in iter_chunks(source, chunksize):
+        yield predict(chunk)
+
+
+def run_stream_prediction(
+    client,
+    blueprint,
+    session_id: int,
+    source: Source,
+    destination: str,
+    chunksize: int = 10_000,
+    task_obj=None,
+    cancel_token=None,
+    **kwargs,
+) -> int:
+    """
+    Task for scoring 'source' chunk by chunk with the model of session 'session_id', writing the output to
+    'destination'. Returns the number of rows written. Cancellation is checked before each chunk.
+    """
+
+    from .sessionmanager import SessionManager
+
+    error = None
+
+    # NB: sessions swallow exceptions on exit, so we re-raise them ourselves for the task to be marked accordingly
+    with SessionManager(client, blueprint).begin_prediction_session(session_id) as session:
+        try:
+            with ChunkWriter(destination) as writer:
+                for chunk in iter_chunks(source, chunksize):
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+
+                    writer.write(session.predict(chunk, **kwargs))
+        except Exception as exc:
+            error = exc
+
+    if error is not None:
+        raise error
+
+    return writer.rows
@@ -0,0 +1,126 @@
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.endpoints import HTTPEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from marshmallow import ValidationError
+from pylurch.contract import database as db, enums as e
+from pyalfred.server.utils import make_base_logger
+from pylurch.contract.schema import BeginSessionRequest, BeginSessionResponse, SESSION_ENDPOINT
+
+
+def _get_create_model(session: Session, name: str, revision: str) -> db.Model:
+    model = session.query(db.Model).filter((db.Model.name == name) & (db.Model.revision == revision)).one_or_none()
+
+    if model is not None:
+        return model
+
+    model = db.Model(name=name, revision=revision)
+    session.add(model)
+    session.flush()
+
+    return model
+
+
+def begin_session(
+    session: Session,
+    session_name: str,
+    model_name: str = None,
+    model_revision: str = None,
+    old_session_id: int = None,
+    retries: int = 5,
+) -> db.TrainingSession:
+    """
+    Gets or creates the model and creates the next version of the training session in a single transaction, retrying
+    if a concurrent transaction claimed the same version first.
+    """
+
+    for attempt in range(retries):
+        try:
+            if old_session_id is not None:
+                old_session = (
+                    session.query(db.TrainingSession).filter(db.TrainingSession.id == old_session_id).one_or_none()
+                )
+
+                if (old_session is None) or not old_session.has_model:
+                    raise ValueError(f"The TrainingSession with id {old_session_id} does not exist!")
+
+                model_id = old_session.model_id
+            elif (model_name is None) or (model_revision is None):
+                raise ValueError("Must pass either the name and revision of the model, or the old session!")
+            else:
+                model_id = _get_create_model(session, model_name, model_revision).id
+
+            latest = (
+                session.query(func.max(db.TrainingSession.version))
+                .filter((db.TrainingSession.model_id == model_id) & (db.TrainingSession.name == session_name))
+                .scalar()
+            )
+
+            training_session = db.TrainingSession(
+                model_id=model_id, name=session_name, version=(latest or 0) + 1, has_model=False
+            )
+            session.add(training_session)
+            session.commit()
+
+            return training_session
+        except IntegrityError:
+            session.rollback()
+
+            if attempt == retries - 1:
+                raise
+        except Exception:
+            session.rollback()
+            raise
+
+
+def make_session_endpoint(session_factory, logger=None) -> type:
+    """
+    Creates an endpoint for beginning training and update sessions in one request, see 'begin_session'. Failures are
+    returned as a 'BeginSessionResponse' with status 'Failed': 400 for invalid requests, 409 if the version could not be
+    claimed within the retries, and 500 for other database errors.
+    """
+
+    logger = logger or make_base_logger("BeginSessionEndpoint")
+
+    class BeginSessionEndpoint(HTTPEndpoint):
+        def _begin(self, kwargs):
+            session = session_factory()
+
+            try:
+                training_session = begin_session(session, **kwargs)
+
+                return {
+                    "status": e.Status.Done,
+                    "id": training_session.id,
+                    "model_id": training_session.model_id,
+                    "name": training_session.name,
+                    "version": training_session.version,
+                }
+            finally:
+                session.close()
+
+        @staticmethod
+        def _fail(message: str, status_code: int) -> JSONResponse:
+            body = BeginSessionResponse().dump({"status": e.Status.Failed, "message": message})
+            return JSONResponse(body, status_code)
+
+        async def post(self, request: Request):
+            try:
+                kwargs = BeginSessionRequest().load(await request.json())
+                result = await run_in_threadpool(self._begin, kwargs)
+            except (ValidationError, ValueError) as exc:
+                return self._fail(str(exc), 400)
+            except IntegrityError as exc:
+                logger.warning(f"Failed to claim a session version: {exc.orig}")
+                return self._fail("Conflicting concurrent sessions, please retry", 409)
+            except SQLAlchemyError as exc:
+                # NB: we do not leak the statement and parameters of the error to the client
+                logger.exception(exc)
+                return self._fail("Failed to begin the session due to a database error", 500)
+
+            return JSONResponse(BeginSessionResponse().dump(result))
+
+    return BeginSessionEndpoint
@@ -0,0 +1,42 @@
+from enum import Enum
+
+
+class Overflow(Enum):
+    Reject = "Reject"
+    DropOldest = "DropOldest"
+
+
+class TaskRejected(Exception):
+    def __init__(self, queue: str, depth: int, wait: float):
+        """
+        Raised when a task is not admitted to 'queue' due to it being overloaded.
+        """
+
+        super().__init__(f"Queue '{queue}' is overloaded with {depth} queued tasks, oldest waiting {wait:.1f}s")
+
+        self.queue = queue
+        self.depth = depth
+        self.wait = wait
+
+
+class AdmissionPolicy(object):
+    def __init__(self, max_depth: int = None, max_wait: float = None, overflow: Overflow = Overflow.Reject):
+        """
+        Limits the number of queued tasks to 'max_depth' and the estimated wait of new tasks to 'max_wait' seconds,
+        where the wait is estimated as the time the oldest queued task has spent in queue. On overflow new tasks are
+        either rejected, or the oldest queued tasks are cancelled to make room for them. Do note that the limits are
+        soft, as concurrent enqueues are not synchronized.
+        """
+
+        self.max_depth = max_depth
+        self.max_wait = max_wait
+        self.overflow = overflow
+
+    def fits(self, incoming: int) -> bool:
+        return (self.max_depth is None) or (incoming <= self.max_depth)
+
+    def is_full(self, depth: int, wait: float, incoming: int = 1) -> bool:
+        if (self.max_depth is not None) and (depth + incoming > self.max_depth):
+            return True
+
+        return (self.max_wait is not None) and (depth > 0) and (wait > self.max_wait)
@@ -0,0 +1,298 @@
+import os
+import mmap
+import pickle
+import tempfile
+from collections import OrderedDict, deque
+from io import BytesIO
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, BinaryIO, Optional, Sequence, Deque, Tuple
+from cachetools import TTLCache
+
+
+class ResultStore(object):
+    """
+    Base class for storing task results.
+    """
+
+    def put(self, key: str, value: Any):
+        raise NotImplementedError()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError()
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """
+        Returns a binary stream of the pickled result, or None if there is no result for 'key'.
+        """
+
+        raise NotImplementedError()
+
+    def delete(self, key: str) -> bool:
+        raise NotImplementedError()
+
+    def expire(self, keys: Sequence[str]) -> int:
+        """
+        Deletes the results of 'keys', returning the number of bytes freed if known by the store.
+        """
+
+        for k in keys:
+            self.delete(k)
+
+        return 0
+
+    def stats(self) -> Dict[str, int]:
+        raise NotImplementedError()
+
+
+class MemoryResultStore(ResultStore):
+    def __init__(self, maxsize: int = 1_000_000_000, ttl: float = 60 * 60):
+        """
+        Keeps results in process memory, bounded by the number of results only.
+        """
+
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def put(self, key, value):
+        with self._lock:
+            self._cache[key] = value
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._cache.get(key, default)
+
+    def open(self, key):
+        with self._lock:
+            if key not in self._cache:
+                return None
+
+            return BytesIO(pickle.dumps(self._cache[key], protocol=pickle.HIGHEST_PROTOCOL))
+
+    def delete(self, key):
+        with self._lock:
+            return self._cache.pop(key, None) is not None
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._cache)}
+
+
+class _Entry(object):
+    __slots__ = ("expires", "size", "value", "path", "raw")
+
+    def __init__(self, expires: float, size: int, value: Any = None, path: str = None, raw: bool = False):
+        self.expires = expires
+        self.size = size
+        self.value = value
+        self.path = path
+        self.raw = raw
+
+
+class SpillingResultStore(ResultStore):
+    def __init__(
+        self,
+        directory: str = None,
+        max_memory_bytes: int = 256 * 1024 ** 2,
+        max_disk_bytes: int = 10 * 1024 ** 3,
+        spill_threshold: int = 16 * 1024 ** 2,
+        ttl: float = 60 * 60,
+    ):
+        """
+        Keeps pickled results in memory up to 'max_memory_bytes', spilling the least recently used ones, as well as any
+        result larger than 'spill_threshold', to files in 'directory'. Spilled results are evicted least recently used
+        first once exceeding 'max_disk_bytes', and all results expire after 'ttl' seconds. Results that cannot be
+        pickled are kept as is in memory, and do not count towards the memory limit.
+        """
+
+        self._directory = directory
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._spill_threshold = spill_threshold
+        self._ttl = ttl
+
+        self._entries = dict()  # type: Dict[str, _Entry]
+
+        # NB: least recently used first, raw results are in neither
+        self._memory = OrderedDict()  # type: OrderedDict[str, _Entry]
+        self._disk = OrderedDict()  # type: OrderedDict[str, _Entry]
+
+        # NB: as the TTL is fixed, insertion order is also expiry order
+        self._expiry = deque()  # type: Deque[Tuple[str, _Entry]]
+
+        self._lock = Lock()
+
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._spills = 0
+        self._evictions = 0
+
+    def _path(self, key: str) -> str:
+        if self._directory is None:
+            self._directory = tempfile.mkdtemp(prefix="pylurch-results-")
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        return os.path.join(self._directory, key)
+
+    def _spill(self, key: str, entry: _Entry):
+        entry.path = self._path(key)
+
+        with open(entry.path, "wb") as f:
+            f.write(entry.value)
+
+        entry.value = None
+
+        del self._memory[key]
+        self._disk[key] = entry
+
+        self._memory_bytes -= entry.size
+        self._disk_bytes += entry.size
+        self._spills += 1
+
+    def _remove(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.pop(key, None)
+
+        if entry is None:
+            return None
+
+        if entry.raw:
+            return entry
+
+        if entry.path is None:
+            del self._memory[key]
+            self._memory_bytes -= entry.size
+        else:
+            del self._disk[key]
+            self._disk_bytes -= entry.size
+
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+        return entry
+
+    def _expire(self):
+        now = monotonic()
+
+        while self._expiry and (self._expiry[0][1].expires <= now):
+            key, entry = self._expiry.popleft()
+
+            # NB: skips entries that have since been replaced or removed
+            if self._entries.get(key) is entry:
+                self._remove(key)
+                self._evictions += 1
+
+    def _enforce(self):
+        while (self._memory_bytes > self._max_memory_bytes) and self._memory:
+            key, entry = next(iter(self._memory.items()))
+            self._spill(key, entry)
+
+        while (self._disk_bytes > self._max_disk_bytes) and self._disk:
+            self._remove(next(iter(self._disk)))
+            self._evictions += 1
+
+    def _make_entry(self, value: Any) -> _Entry:
+        expires = monotonic() + self._ttl
+
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return _Entry(expires, 0, value=value, raw=True)
+
+        return _Entry(expires, len(data), value=data)
+
+    def put(self, key, value):
+        entry = self._make_entry(value)
+
+        with self._lock:
+            self._remove(key)
+            self._expire()
+
+            self._entries[key] = entry
+            self._expiry.append((key, entry))
+
+            if entry.raw:
+                return
+
+            self._memory[key] = entry
+            self._memory_bytes += entry.size
+
+            if entry.size > self._spill_threshold:
+                self._spill(key, entry)
+
+            self._enforce()
+
+    def _get_entry(self, key: str) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.expires <= monotonic():
+            self._remove(key)
+            self._evictions += 1
+            return None
+
+        if not entry.raw:
+            (self._memory if entry.path is None else self._disk).move_to_end(key)
+
+        return entry
+
+    def open(self, key):
+        with self._lock:
+            entry = self._get_entry(key)
+
+            if entry is None:
+                return None
+
+            if entry.raw:
+                raise TypeError(f"The result of '{key}' cannot be pickled!")
+
+            if entry.path is None:
+                return BytesIO(entry.value)
+
+            return open(entry.path, "rb")
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._get_entry(key)
+
+            if entry is None:
+                return default
+
+            if entry.raw:
+                return entry.value
+
+            if entry.path is None:
+                return pickle.loads(entry.value)
+
+            with open(entry.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return pickle.loads(m)
+
+    def delete(self, key):
+        with self._lock:
+            return self._remove(key) is not None
+
+    def expire(self, keys):
+        freed = 0
+
+        with self._lock:
+            for k in keys:
+                entry = self._remove(k)
+
+                if entry is not None:
+                    freed += entry.size
+
+        return freed
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "spills": self._spills,
+                "evictions": self._evictions,
+            }
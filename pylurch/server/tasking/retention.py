@@ -0,0 +1,181 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+from functools import reduce
+from threading import Lock
+from typing import Callable, List, Sequence, Union, Any
+from pyalfred.contract.client import Client
+from pylurch.contract import database as db
+from .tasks import CancellationToken
+
+
+Archive = Callable[[Sequence[db.Task], Sequence[db.TaskMeta], Sequence[db.TaskException]], None]
+
+
+class PruneReport(object):
+    def __init__(self, tasks=0, metas=0, exceptions=0, row_bytes=0, result_bytes=0):
+        """
+        Summary of what was reclaimed by 'prune_tasks'. Row bytes are estimated from the column values of the deleted
+        rows, and so do not include any storage overhead of the database itself.
+        """
+
+        self.tasks = tasks
+        self.metas = metas
+        self.exceptions = exceptions
+        self.row_bytes = row_bytes
+        self.result_bytes = result_bytes
+
+    @property
+    def rows(self) -> int:
+        return self.tasks + self.metas + self.exceptions
+
+    @property
+    def bytes(self) -> int:
+        return self.row_bytes + self.result_bytes
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(tasks={self.tasks}, metas={self.metas}, exceptions={self.exceptions}, "
+            f"row_bytes={self.row_bytes}, result_bytes={self.result_bytes})"
+        )
+
+
+def _as_list(result: Union[Any, List[Any], None]) -> List[Any]:
+    if result is None:
+        return list()
+
+    if isinstance(result, (list, tuple)):
+        return list(result)
+
+    return [result]
+
+
+def _to_dict(obj: db.Base) -> dict:
+    return {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
+
+
+def estimate_size(obj: db.Base) -> int:
+    size = 0
+
+    for v in _to_dict(obj).values():
+        if isinstance(v, str):
+            size += len(v.encode())
+        elif isinstance(v, bytes):
+            size += len(v)
+        elif v is not None:
+            size += 8
+
+    return size
+
+
+class JsonLinesArchive(object):
+    def __init__(self, path: str):
+        """
+        Archives pruned tasks to a gzipped file of JSON lines, one line per task with its metadata and exceptions.
+        """
+
+        self._path = path
+        self._lock = Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def __call__(self, tasks, metas, exceptions):
+        by_task = dict()
+
+        for m in metas:
+            by_task.setdefault(m.task_id, dict())[m.key] = m.value
+
+        errors = dict()
+
+        for exc in exceptions:
+            errors.setdefault(exc.task_id, list()).append({"type": exc.type_, "message": exc.message})
+
+        with self._lock, gzip.open(self._path, "at", encoding="utf-8") as f:
+            for t in tasks:
+                row = _to_dict(t)
+                row["status"] = t.status.value
+                row["meta"] = by_task.get(t.id, dict())
+                row["exceptions"] = errors.get(t.id, list())
+
+                f.write(json.dumps(row, default=str) + "\n")
+
+
+def prune_tasks(
+    client: Client,
+    max_age: timedelta,
+    batch_size: int = 100,
+    archive: Archive = None,
+    expire: Callable[[Sequence[str]], int] = None,
+    task_obj: db.Task = None,
+    cancel_token: CancellationToken = None,
+) -> PruneReport:
+    """
+    Deletes tasks that finished more than 'max_age' ago, together with their metadata and exceptions, paging through
+    the tasks in windows of 'batch_size' ids. If passed, each batch is handed to 'archive' before being deleted, and
+    the keys of the batch to 'expire', which should remove the results and return the number of bytes freed. Queued
+    and running tasks are never pruned as their end time is not yet set. When run as a task, cancellation is checked
+    between batches.
+    """
+
+    cutoff = datetime.now() - max_age
+    report = PruneReport()
+
+    def is_finished(u):
+        return u.end_time < cutoff
+
+    first = client.get(db.Task, is_finished, one=True, operations="order by id,first")
+    last = client.get(db.Task, is_finished, one=True, operations="order by id desc,first")
+
+    if (first is None) or (last is None):
+        return report
+
+    # NB: pages through windows of ids so that no query returns more than 'batch_size' tasks
+    for low in range(first.id, last.id + 1, batch_size):
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+        high = low + batch_size
+
+        def in_window(u):
+            return (u.id >= low) & (u.id < high) & (u.end_time < cutoff)
+
+        batch = _as_list(client.get(db.Task, in_window))
+
+        if not batch:
+            continue
+
+        ids = [t.id for t in batch]
+
+        def f(u):
+            return reduce(lambda x, y: x | y, (u.task_id == j for j in ids))
+
+        metas = _as_list(client.get(db.TaskMeta, f))
+        exceptions = _as_list(client.get(db.TaskException, f))
+
+        if archive is not None:
+            archive(batch, metas, exceptions)
+
+        # NB: children first due to the foreign keys
+        for children in (metas, exceptions):
+            if children:
+                client.delete(children)
+
+        client.delete(batch)
+
+        report.tasks += len(batch)
+        report.metas += len(metas)
+        report.exceptions += len(exceptions)
+        report.row_bytes += sum(estimate_size(o) for o in batch + metas + exceptions)
+
+        if expire is not None:
+            report.result_bytes += expire([t.key for t in batch])
+
+    return report
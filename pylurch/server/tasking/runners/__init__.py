@@ -1,2 +1,4 @@
 from .redis import RQRunner
 from .executor import ExecutorRunner
+from .process import ProcessPoolRunner
+from .aio import AsyncioRunner
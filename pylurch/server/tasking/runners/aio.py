@@ -0,0 +1,73 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Thread
+from pylurch.contract import enums as e
+from ..tasks import BaseTask
+from ..tasks.base import accepts_argument
+from ..tasks.cancellation import TaskCancelled
+from .executor import ExecutorRunner
+
+
+class AsyncioRunner(ExecutorRunner):
+    def __init__(
+        self,
+        client,
+        loop: asyncio.AbstractEventLoop = None,
+        max_io_workers: int = 4,
+        results=None,
+        admission=None,
+    ):
+        """
+        Class for enqueuing I/O bound coroutine functions on an event loop, without a thread per task. If no loop is
+        passed, one is run in a background thread. Task state is written using a small pool of 'max_io_workers'
+        threads so as not to block the loop. As coroutines are started immediately, any admission limits apply to all
+        tasks in flight rather than only queued ones.
+        """
+
+        super().__init__(client, executor=ThreadPoolExecutor(max_io_workers), results=results, admission=admission)
+
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            Thread(target=loop.run_forever, daemon=True).start()
+
+        self._loop = loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    def make_task(self, f, *args, **kwargs) -> BaseTask:
+        if not asyncio.iscoroutinefunction(f):
+            raise TypeError(f"'{f.__name__}' must be a coroutine function!")
+
+        return super().make_task(f, *args, **kwargs)
+
+    async def _run(self, task: BaseTask):
+        loop = asyncio.get_running_loop()
+
+        kwargs = dict(task._kwargs or dict())
+        kwargs["task_obj"] = task.db
+
+        if accepts_argument(task.function, "cancel_token"):
+            kwargs["cancel_token"] = task.token
+
+        await loop.run_in_executor(self._exc, setattr, task, "status", e.Status.Running)
+
+        try:
+            result = await asyncio.wait_for(task.function(*(task._args or tuple()), **kwargs), task.timeout)
+        except (asyncio.CancelledError, TaskCancelled):
+            await loop.run_in_executor(self._exc, setattr, task, "status", e.Status.Cancelled)
+            raise
+        except Exception as exc:
+            await loop.run_in_executor(self._exc, task.fail, exc)
+            raise
+
+        await loop.run_in_executor(self._exc, setattr, task, "status", e.Status.Done)
+
+        return result
+
+    def _can_time_out(self, task):
+        return True
+
+    def _submit(self, task: BaseTask) -> Future:
+        return asyncio.run_coroutine_threadsafe(self._run(task), self._loop)
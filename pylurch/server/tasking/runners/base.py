@@ -1,25 +1,44 @@
-from typing import Callable, Any, Optional
+import asyncio
+from collections import Counter
+from datetime import datetime, timedelta
+from threading import Event, Thread
+from time import sleep, monotonic
+from typing import Callable, Any, Optional, Iterable, Sequence, List, Tuple, Dict, Union
 from logging import Logger
 from ..tasks import BaseTask
+from ..retention import prune_tasks, PruneReport, Archive
+from ..admission import AdmissionPolicy, Overflow, TaskRejected
 from pyalfred.server.utils import make_base_logger
 from pylurch.contract import enums as e, database as db
 from pyalfred.contract.client import Client
 
 
+TERMINAL_STATUSES = (e.Status.Done, e.Status.Failed, e.Status.Cancelled, e.Status.Unknown)
+
+
 class BaseRunner(object):
-    def __init__(self, client: Client, logger: Logger = None):
+    def __init__(
+        self,
+        client: Client,
+        logger: Logger = None,
+        admission: Union[AdmissionPolicy, Dict[str, AdmissionPolicy]] = None,
+    ):
         """
-        Base class for enqueuing tasks.
+        Base class for enqueuing tasks. If passed, 'admission' limits the number of queued tasks, either for all queues
+        of the runner or per queue name. Tasks that are not admitted raise 'TaskRejected' when enqueued.
         """
 
         self._client = client
         self._logger = logger or make_base_logger(self.__class__.__name__)
+        self._admission = admission
 
     def make_task(self, f, *args, **kwargs) -> BaseTask:
         raise NotImplementedError()
 
     def enqueue(self, f: Callable[..., Any], *args, **kwargs) -> str:
         task = self.make_task(f, *args, **kwargs)
+
+        self._admit([task])
         self._enqueue(task)
 
         return task.key
@@ -27,6 +46,139 @@ class BaseRunner(object):
     def _enqueue(self, task: BaseTask):
         raise NotImplementedError()
 
+    def enqueue_with(
+        self,
+        f: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        kwargs: Dict[str, Any] = None,
+        timeout: float = None,
+        flush_interval: float = None,
+        **options,
+    ) -> str:
+        """
+        Same as 'enqueue', but with options for the task itself, such as a 'timeout' in seconds or how often, in seconds,
+        to write intermediate status and metadata updates. Any other 'options' are specific to the runner.
+        """
+
+        task = self.make_task(f, *args, **(kwargs or dict()))
+
+        if timeout is not None:
+            task.timeout = timeout
+
+        if flush_interval is not None:
+            task.flush_interval = flush_interval
+
+        self._configure(task, **options)
+
+        self._admit([task])
+        self._enqueue(task)
+
+        return task.key
+
+    def _configure(self, task: BaseTask, **options):
+        if options:
+            raise TypeError(f"'{self.__class__.__name__}' does not support options: {', '.join(options)}")
+
+    def cancel(self, key: str, force: bool = False) -> bool:
+        """
+        Cancels the task, dropping it if it has not yet started and otherwise signalling its cancellation token. Running
+        tasks not checking the token finish their call, but are kept as cancelled and their result is discarded. If
+        'force' is set, running tasks are stopped immediately where supported by the runner. Returns whether the task
+        was cancelled.
+        """
+
+        task = self.get_task(key)
+
+        if (task is None) or (task.status in TERMINAL_STATUSES):
+            return False
+
+        self._cancel(key, force)
+
+        task.status = e.Status.Cancelled
+        task.end_time = datetime.now()
+        self._client.update(task)
+
+        return True
+
+    def _cancel(self, key: str, force: bool):
+        return
+
+    def enqueue_many(self, f: Callable[..., Any], args: Iterable[Tuple[Any, ...]], **kwargs) -> List[str]:
+        """
+        Enqueues 'f' once per tuple of positional arguments in 'args', with 'kwargs' shared between all calls. Task rows
+        are created in bulk.
+        """
+
+        tasks = [self.make_task(f, *a, **kwargs) for a in args]
+
+        if not tasks:
+            return list()
+
+        self._admit(tasks)
+        self._enqueue_many(tasks)
+
+        return [t.key for t in tasks]
+
+    def _queue_of(self, task: BaseTask) -> str:
+        return "default"
+
+    def depth(self, queue: str = "default") -> int:
+        """
+        Returns the number of tasks waiting to be run on 'queue'.
+        """
+
+        raise NotImplementedError()
+
+    def _oldest_queued(self, queue: str) -> Optional[Tuple[str, float]]:
+        # NB: returns the key of the oldest task waiting on 'queue' together with how long it has waited in seconds
+        raise NotImplementedError()
+
+    def _get_policy(self, queue: str) -> Optional[AdmissionPolicy]:
+        if isinstance(self._admission, dict):
+            return self._admission.get(queue)
+
+        return self._admission
+
+    def _admit(self, tasks: Sequence[BaseTask]):
+        for queue, incoming in Counter(self._queue_of(t) for t in tasks).items():
+            policy = self._get_policy(queue)
+
+            if policy is None:
+                continue
+
+            dropped = set()
+
+            while True:
+                depth = self.depth(queue)
+                oldest = self._oldest_queued(queue)
+                wait = oldest[1] if oldest is not None else 0.0
+
+                if not policy.is_full(depth, wait, incoming):
+                    break
+
+                # NB: we never shed queued tasks for a batch that would not fit regardless
+                rejected = (policy.overflow == Overflow.Reject) or not policy.fits(incoming)
+
+                if rejected or (oldest is None) or (oldest[0] in dropped):
+                    raise TaskRejected(queue, depth, wait)
+
+                dropped.add(oldest[0])
+                self.cancel(oldest[0])
+
+            if dropped:
+                self._logger.warning(f"Shed {len(dropped)} queued tasks from '{queue}' due to overload")
+
+    def _initialize_many(self, tasks: Sequence[BaseTask], keys: Sequence[str] = None):
+        keys = keys or [None] * len(tasks)
+        created = self._client.create([t.make_db(k) for t, k in zip(tasks, keys)], batched=True)
+
+        for t, c in zip(tasks, created):
+            t.bind(c)
+
+    def _enqueue_many(self, tasks: Sequence[BaseTask]):
+        for t in tasks:
+            self._enqueue(t)
+
     def get_task(self, key) -> db.Task:
         return self._client.get(db.Task, lambda u: u.key == key, one=True)
 
@@ -38,9 +190,88 @@ class BaseRunner(object):
 
         return task.status
 
+    def wait(self, key: str, timeout: float = None) -> e.Status:
+        """
+        Blocks until the task reaches a terminal status or 'timeout' seconds have passed, returning the latest known
+        status. Defaults to polling, override for push based notifications.
+        """
+
+        deadline = None if timeout is None else monotonic() + timeout
+        interval = 0.05
+
+        while True:
+            status = self.check_status(key)
+
+            if (status in TERMINAL_STATUSES) or ((deadline is not None) and (monotonic() >= deadline)):
+                return status
+
+            sleep(interval if deadline is None else max(min(interval, deadline - monotonic()), 0.0))
+            interval = min(2 * interval, 1.0)
+
+    async def wait_async(self, key: str, timeout: float = None) -> e.Status:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.wait, key, timeout)
+
     def get_result(self, task_id: str) -> Any:
         raise NotImplementedError()
 
+    def expire_results(self, keys: Sequence[str]) -> int:
+        """
+        Removes the results of the tasks with 'keys', returning the number of bytes freed if known.
+        """
+
+        return 0
+
+    def _make_expire(self) -> Optional[Callable[[Sequence[str]], int]]:
+        # NB: returns the callable used for expiring results from within an enqueued pruning task, if any
+        return self.expire_results
+
+    def prune(self, max_age: timedelta, batch_size: int = 100, archive: Archive = None) -> PruneReport:
+        """
+        Deletes, and optionally archives, tasks that finished more than 'max_age' ago together with their results. See
+        'prune_tasks'.
+        """
+
+        report = prune_tasks(self._client, max_age, batch_size=batch_size, archive=archive, expire=self.expire_results)
+        self._logger.info(f"Pruned {report.rows} rows, reclaiming approximately {report.bytes} bytes")
+
+        return report
+
+    def schedule(self, interval: float, f: Callable[..., Any], *args, **kwargs) -> Event:
+        """
+        Enqueues 'f' every 'interval' seconds until the returned event is set.
+        """
+
+        stop = Event()
+
+        def loop():
+            while not stop.wait(interval):
+                try:
+                    self.enqueue(f, *args, **kwargs)
+                except Exception as exc:
+                    self._logger.exception(exc)
+
+        Thread(target=loop, daemon=True).start()
+
+        return stop
+
+    def schedule_pruning(
+        self, interval: float, max_age: timedelta, batch_size: int = 100, archive: Archive = None
+    ) -> Event:
+        """
+        Periodically enqueues 'prune_tasks' as a task of this runner, with the report as its result.
+        """
+
+        return self.schedule(
+            interval,
+            prune_tasks,
+            self._client,
+            max_age,
+            batch_size=batch_size,
+            archive=archive,
+            expire=self._make_expire(),
+        )
+
     def get_exception(self, key: str) -> Optional[db.TaskException]:
         task = self._client.get(db.Task, lambda u: u.key == key, one=True)
 
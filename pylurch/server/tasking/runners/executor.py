@@ -1,40 +1,177 @@
-from concurrent.futures import Executor, ThreadPoolExecutor, Future
+import asyncio
+from typing import Any, Optional, Tuple
+from datetime import datetime
+from threading import Lock
+from concurrent.futures import Executor, ThreadPoolExecutor, Future, TimeoutError
 from cachetools import TTLCache
 from ..tasks import BaseTask
+from ..tasks.base import accepts_argument
+from ..tasks.cancellation import LocalCancellationToken
+from ..results import ResultStore, SpillingResultStore
 from .base import BaseRunner
-from pylurch.contract import enums as e, database as db
+from pylurch.contract import enums as e
 
 
 class ExecutorRunner(BaseRunner):
-    def __init__(self, client, executor: Executor = None):
+    def __init__(self, client, executor: Executor = None, results: ResultStore = None, admission=None):
         """
         Class for enqueuing tasks using 'concurrent.futures.Executor' as task manager. Do note that this is for
         debugging purposes rather than production use.
         """
 
-        super().__init__(client)
+        super().__init__(client, admission=admission)
 
         self._exc = executor or ThreadPoolExecutor()
-        self._results = TTLCache(maxsize=1_000_000_000, ttl=60 * 60)
+        self._results = results or SpillingResultStore()
+        self._completions = TTLCache(maxsize=1_000_000, ttl=60 * 60)
+        self._handles = TTLCache(maxsize=1_000_000, ttl=60 * 60)
+        self._lock = Lock()
 
-    def _enqueue(self, task):
-        task.initialize()
-        future = self._exc.submit(task._f, *task._args, **task._kwargs)
-        future.add_done_callback(lambda u: self._done_callback(u, task_id=task.db.id, key=task.key))
+    def _enqueue(self, task, initialize=True):
+        if initialize:
+            task.initialize()
 
-    def _done_callback(self, u: Future, task_id: int, key: str):
-        task = self._client.get(db.Task, lambda x: x.id == task_id, one=True)
+        self._completions[task.key] = Future()
 
-        if u.done():
-            self._results.update({key: u.result()})
-            task.status = e.Status.Done
-        else:
-            task.status = e.Status.Failed
+        future = self._submit(task)
 
-        self._client.update(task)
+        with self._lock:
+            self._handles[task.key] = (future, task)
+
+        future.add_done_callback(lambda u: self._done_callback(u, key=task.key))
+
+    def _submit(self, task: BaseTask) -> Future:
+        return self._exc.submit(task._f, *task._args, **task._kwargs)
+
+    def _enqueue_many(self, tasks):
+        self._initialize_many(tasks)
+
+        for t in tasks:
+            self._enqueue(t, initialize=False)
+
+    def _done_callback(self, u: Future, key: str):
+        # NB: the task's status is set by the task itself, see 'FunctionDecorator'
+        status = e.Status.Unknown
+
+        with self._lock:
+            handle = self._handles.pop(key, None)
+
+        try:
+            if u.cancelled() or ((handle is not None) and (handle[1].status == e.Status.Cancelled)):
+                status = e.Status.Cancelled
+            elif (handle is not None) and (handle[1].status == e.Status.Failed):
+                # NB: the task may have been failed from outside of the function, e.g. when timing out
+                status = e.Status.Failed
+            elif u.exception() is None:
+                status = self._store_result(key, u.result(), handle)
+            else:
+                status = e.Status.Failed
+        finally:
+            self._resolve(key, status)
+
+    def _resolve(self, key: str, status: e.Status):
+        with self._lock:
+            completion = self._completions.get(key)
+
+            if (completion is None) or completion.done():
+                return
+
+            completion.set_result(status)
+
+    def _store_result(self, key: str, result: Any, handle: Optional[Tuple[Future, BaseTask]]) -> e.Status:
+        try:
+            self._results.put(key, result)
+        except Exception as exc:
+            # NB: the task has already been marked as done, so we record that its result was lost
+            self._logger.exception(exc)
+
+            if handle is not None:
+                handle[1].fail(exc)
+
+            return e.Status.Failed
+
+        return e.Status.Done
+
+    def _queued(self):
+        with self._lock:
+            return [t for f, t in self._handles.values() if not (f.running() or f.done())]
+
+    def depth(self, queue="default"):
+        return len(self._queued())
+
+    def _oldest_queued(self, queue):
+        queued = self._queued()
+
+        if not queued:
+            return None
+
+        oldest = min(queued, key=lambda t: t.db.start_time)
+
+        return oldest.key, (datetime.now() - oldest.db.start_time).total_seconds()
+
+    def _cancel(self, key, force):
+        with self._lock:
+            handle = self._handles.get(key)
+
+        if handle is None:
+            return
+
+        future, task = handle
+
+        if isinstance(task.token, LocalCancellationToken):
+            task.token.cancel()
+
+        future.cancel()
+
+    def _configure(self, task, **options):
+        super()._configure(task, **options)
+
+        if (task.timeout is not None) and not self._can_time_out(task):
+            raise TypeError(
+                f"'{task.function.__name__}' must accept a 'cancel_token' to be timed out by '{self.__class__.__name__}'"
+            )
+
+    def _can_time_out(self, task: BaseTask) -> bool:
+        # NB: threads cannot be stopped, so timeouts rely on the function checking its cancellation token
+        return accepts_argument(task.function, "cancel_token")
 
     def make_task(self, f, *args, **kwargs) -> BaseTask:
         return BaseTask(f, self._client, args=args, kwargs=kwargs)
 
+    def wait(self, key, timeout=None):
+        completion = self._completions.get(key)
+
+        if completion is None:
+            return self.check_status(key)
+
+        try:
+            return completion.result(timeout)
+        except TimeoutError:
+            return self.check_status(key)
+
+    async def wait_async(self, key, timeout=None):
+        completion = self._completions.get(key)
+
+        if completion is None:
+            return self.check_status(key)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(completion)), timeout)
+        except asyncio.TimeoutError:
+            return self.check_status(key)
+
+    @property
+    def results(self) -> ResultStore:
+        return self._results
+
     def get_result(self, task_id):
         return self._results.get(task_id, None)
+
+    def expire_results(self, keys):
+        for k in keys:
+            self._completions.pop(k, None)
+
+        return self._results.expire(keys)
+
+    def open_result(self, task_id):
+        return self._results.open(task_id)
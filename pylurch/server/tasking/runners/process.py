@@ -0,0 +1,63 @@
+from concurrent.futures import ProcessPoolExecutor, Future
+from threading import Timer
+from pylurch.contract import enums as e
+from ..tasks import BaseTask
+from .executor import ExecutorRunner
+
+
+class ProcessPoolRunner(ExecutorRunner):
+    def __init__(self, client, max_workers: int = None, results=None, admission=None):
+        """
+        Class for enqueuing CPU bound tasks in a 'concurrent.futures.ProcessPoolExecutor'. Only the function itself is
+        run in the child process, all bookkeeping of task state is done by the parent. Do note that tasks are marked as
+        running when submitted, as the pool does not report when a task is picked up.
+
+        Running tasks cannot be stopped, cancelling one instead discards its result once it finishes. Timeouts are
+        enforced by the parent, which fails the task and stops waiting for it once timed out, although the child
+        process is left to finish the call.
+        """
+
+        super().__init__(client, executor=ProcessPoolExecutor(max_workers), results=results, admission=admission)
+
+    def _submit(self, task: BaseTask) -> Future:
+        task.status = e.Status.Running
+
+        kwargs = dict(task._kwargs or dict())
+        kwargs["task_obj"] = task.db
+
+        future = self._exc.submit(task.function, *(task._args or tuple()), **kwargs)
+        future.add_done_callback(lambda u: self._update_task(u, task))
+
+        if task.timeout is not None:
+            timer = Timer(task.timeout, self._time_out, args=(future, task))
+            timer.daemon = True
+            timer.start()
+
+            future.add_done_callback(lambda u: timer.cancel())
+
+        return future
+
+    def _time_out(self, future: Future, task: BaseTask):
+        if future.done() or future.cancel():
+            return
+
+        task.fail(TimeoutError("The task timed out!"))
+        self._resolve(task.key, e.Status.Failed)
+
+    def _can_time_out(self, task):
+        return True
+
+    def _make_expire(self):
+        # NB: the parent's result store cannot be reached from the child processes, results instead expire by TTL
+        return None
+
+    def _update_task(self, u: Future, task: BaseTask):
+        if task.status in (e.Status.Failed, e.Status.Cancelled):
+            return
+
+        if u.cancelled() or task.token.is_cancelled():
+            task.status = e.Status.Cancelled
+        elif u.exception() is None:
+            task.status = e.Status.Done
+        else:
+            task.fail(u.exception())
@@ -1,45 +1,243 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Sequence, List, Dict, Any, Optional
 from redis import Redis
-from rq import Queue
-from pyalfred.contract.client import Client
+from redis.exceptions import ResponseError
+from time import monotonic, sleep
+from rq import Queue, get_current_job
+from rq.job import Job, JobStatus
+from rq.command import send_stop_job_command
 from pylurch.contract.enums import Status
-from pylurch.contract.database import Task
 from ..tasks import RQTask
-from .base import BaseRunner
+from ..tasks.redis import make_channel, make_wait_key
+from ..tasks.cancellation import make_cancel_key
+from .base import BaseRunner, TERMINAL_STATUSES
+from .routing import Router
 
 
-def _when_done(task_id: int, interface: Client):
-    task = interface.get(Task, lambda u: u.id == task_id, one=True)
+def expire_jobs(keys: Sequence[str], conn: Redis = None) -> int:
+    """
+    Deletes the RQ jobs, and thus results, of 'keys', returning the number of bytes freed as reported by Redis. If no
+    connection is passed, the one of the current job is used.
+    """
 
-    if task.status != Status.Running:
-        task.status = Status.Unknown
-    else:
-        task.status = Status.Done
+    conn = conn or get_current_job().connection
+    jobs = [j for j in Job.fetch_many(keys, connection=conn) if j is not None]
 
-    interface.update(task)
+    freed = 0
+
+    for j in jobs:
+        try:
+            freed += conn.memory_usage(j.key) or 0
+        except ResponseError:
+            pass
+
+    with conn.pipeline() as pipe:
+        for j in jobs:
+            j.delete(pipeline=pipe)
+
+        pipe.execute()
+
+    return freed
+
+
+def _seconds_since(t: datetime) -> float:
+    now = datetime.now(timezone.utc) if t.tzinfo is not None else datetime.utcnow()
+    return max((now - t).total_seconds(), 0.0)
+
+
+def _summarize(samples: Sequence[float]) -> Dict[str, float]:
+    if not samples:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+
+    ordered = sorted(samples)
+
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[int(0.5 * (len(ordered) - 1))],
+        "p95": ordered[int(0.95 * (len(ordered) - 1))],
+        "max": ordered[-1],
+    }
 
 
 class RQRunner(BaseRunner):
-    def __init__(self, conn: Redis, client, **kwargs):
+    def __init__(
+        self,
+        conn: Redis,
+        client,
+        queues: Sequence[str] = None,
+        router: Router = None,
+        admission=None,
+        **kwargs,
+    ):
         """
-        Class for enqueuing tasks using 'RQ'.
+        Class for enqueuing tasks using 'RQ'. Tasks are routed to one of several named 'queues' by 'router', which
+        defaults to sending everything to a single queue. As RQ workers drain the queues they listen to in order,
+        'queues' should be given in order of priority and workers started as 'Worker(runner.queues)'. Latency sensitive
+        work may further be given dedicated workers by only listening to its queue. For backwards compatibility 'name'
+        may be passed in 'kwargs', naming the default queue.
         """
 
-        super().__init__(client)
+        super().__init__(client, admission=admission)
         self._conn = conn
-        self._queue = Queue(connection=conn, **kwargs)
+
+        # NB: 'name' used to be forwarded to the single queue of the runner, which now is one of many
+        name = kwargs.pop("name", None)
+        self._router = router or Router(default=name or "default")
+
+        names = list(queues or ())
+
+        if (name is not None) and (name not in names):
+            names.insert(0, name)
+        names += [q for q in self._router.queues if q not in names]
+
+        self._queues = OrderedDict()  # type: OrderedDict[str, Queue]
+
+        for n in names:
+            self._queues[n] = Queue(n, connection=conn, **kwargs)
+
+    @property
+    def router(self) -> Router:
+        return self._router
+
+    @property
+    def queues(self) -> List[Queue]:
+        return list(self._queues.values())
+
+    def get_queue(self, name: str) -> Queue:
+        if name not in self._queues:
+            raise KeyError(f"No queue named '{name}', must be one of: {', '.join(self._queues)}")
+
+        return self._queues[name]
+
+    def _configure(self, task: RQTask, queue: str = None, **options):
+        super()._configure(task, **options)
+
+        if queue is not None:
+            task.queue = self.get_queue(queue).name
 
     def _enqueue(self, task: RQTask):
-        rq_task = task.make_rqtask(self._queue)
+        queue = self.get_queue(task.queue)
+
+        rq_task = task.make_rqtask(queue)
         task.initialize(rq_task.id)
 
-        self._queue.enqueue_job(rq_task)
-        self._queue.enqueue(_when_done, task.db.id, self._client, depends_on=rq_task)
+        queue.enqueue_job(rq_task)
+
+    def _enqueue_many(self, tasks):
+        queues = [self.get_queue(t.queue) for t in tasks]
+
+        jobs = [t.make_rqtask(q) for t, q in zip(tasks, queues)]
+        self._initialize_many(tasks, [j.id for j in jobs])
+
+        with self._conn.pipeline() as pipe:
+            for j, q in zip(jobs, queues):
+                q.enqueue_job(j, pipeline=pipe)
+
+            pipe.execute()
+
+    def _fetch_job(self, key: str) -> Optional[Job]:
+        return Job.fetch_many([key], connection=self._conn)[0]
+
+    def _cancel(self, key, force):
+        self._conn.set(make_cancel_key(key), 1, ex=24 * 3600)
+
+        job = self._fetch_job(key)
+
+        if job is not None:
+            status = job.get_status()
+
+            if status in (JobStatus.QUEUED, JobStatus.DEFERRED, JobStatus.SCHEDULED):
+                job.cancel()
+            elif force and (status == JobStatus.STARTED):
+                send_stop_job_command(self._conn, key)
+
+        self._conn.publish(make_channel(key), Status.Cancelled.value)
+
+    def queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns per queue the number of queued and running jobs, the age in seconds of the oldest queued job, and a
+        summary of the time spent in queue by recently started jobs.
+        """
+
+        result = OrderedDict()
+
+        for name, queue in self._queues.items():
+            oldest = self._oldest_queued(name)
+            samples = [float(v) for v in self._conn.lrange(make_wait_key(name), 0, -1)]
+
+            result[name] = {
+                "depth": queue.count,
+                "running": queue.started_job_registry.count,
+                "oldest": oldest[1] if oldest is not None else 0.0,
+                "wait": _summarize(samples),
+            }
+
+        return result
+
+    def _queue_of(self, task: RQTask) -> str:
+        return task.queue
+
+    def depth(self, queue="default"):
+        return self.get_queue(queue).count
+
+    def _oldest_queued(self, queue):
+        head = self.get_queue(queue).get_job_ids(0, 1)
+        job = self._fetch_job(head[0]) if head else None
+
+        if (job is None) or (job.enqueued_at is None):
+            return None
+
+        return job.id, _seconds_since(job.enqueued_at)
 
     def make_task(self, f, *args, **kwargs) -> RQTask:
-        return RQTask(f, self._client, args=args, kwargs=kwargs)
+        return RQTask(f, self._client, args=args, kwargs=kwargs, queue=self._router.route(f, args, kwargs))
+
+    def wait(self, key: str, timeout: float = None) -> Status:
+        pubsub = self._conn.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(make_channel(key))
+
+        deadline = None if timeout is None else monotonic() + timeout
+
+        try:
+            # NB: we check the status after subscribing so as to not miss transitions in between
+            status = self.check_status(key)
+
+            while status not in TERMINAL_STATUSES:
+                remaining = None if deadline is None else deadline - monotonic()
+
+                if (remaining is not None) and (remaining <= 0.0):
+                    break
+
+                message = pubsub.get_message(timeout=1.0 if remaining is None else min(remaining, 1.0))
+
+                if message is not None:
+                    status = Status(message["data"].decode() if isinstance(message["data"], bytes) else message["data"])
+
+            if status == Status.Done:
+                self._wait_for_result(key, deadline)
+
+            return status
+        finally:
+            pubsub.close()
+
+    def _wait_for_result(self, key: str, deadline: float = None):
+        # NB: tasks are marked as done just before RQ persists the result, so we give it a moment to do so
+        job = self._fetch_job(key)
+        stop = monotonic() + 1.0 if deadline is None else min(deadline, monotonic() + 1.0)
+
+        while (job is not None) and (job.get_status(refresh=True) != JobStatus.FINISHED) and (monotonic() < stop):
+            sleep(0.01)
+
+    def expire_results(self, keys):
+        return expire_jobs(keys, self._conn)
+
+    def _make_expire(self):
+        return expire_jobs
 
     def get_result(self, task_id):
-        job = self._queue.fetch_job(task_id)
+        job = self._fetch_job(task_id)
 
         if job is None:
             return None
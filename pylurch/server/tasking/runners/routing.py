@@ -0,0 +1,82 @@
+from typing import Callable, Any, Tuple, Dict, List, Union
+
+
+Predicate = Callable[[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]], bool]
+
+
+def _function_name(f: Callable[..., Any]) -> str:
+    return getattr(f, "__qualname__", None) or getattr(f, "__name__", None) or f.__class__.__qualname__
+
+
+def find_blueprint_name(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """
+    Returns the name of the first blueprint found among the arguments of a task, if any.
+    """
+
+    from pylurch.inference.blueprint import InferenceModelBlueprint
+
+    for v in tuple(args) + tuple(kwargs.values()):
+        if isinstance(v, InferenceModelBlueprint):
+            return v.name()
+
+    return None
+
+
+class Router(object):
+    def __init__(self, default: str = "default"):
+        """
+        Routes tasks to named queues. Rules are evaluated in the order they were added, with the first match winning,
+        and tasks not matching any rule are sent to 'default'.
+        """
+
+        self._default = default
+        self._rules = list()  # type: List[Tuple[str, Predicate]]
+
+    @property
+    def default(self) -> str:
+        return self._default
+
+    @property
+    def queues(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys([self._default] + [q for q, _ in self._rules]))
+
+    def add(
+        self,
+        queue: str,
+        function: Union[str, Callable[..., Any]] = None,
+        blueprint: str = None,
+        predicate: Predicate = None,
+    ):
+        """
+        Adds a rule sending tasks to 'queue'. Tasks may be matched on the 'function' itself or its qualified name, on
+        the name of a blueprint passed as an argument to the task, or on an arbitrary 'predicate' of the function and
+        its arguments. If several are passed, all must match.
+        """
+
+        checks = list()
+
+        if function is not None:
+            if isinstance(function, str):
+                checks.append(lambda f, a, k: _function_name(f) == function)
+            else:
+                checks.append(lambda f, a, k: f is function)
+
+        if blueprint is not None:
+            checks.append(lambda f, a, k: find_blueprint_name(a, k) == blueprint)
+
+        if predicate is not None:
+            checks.append(predicate)
+
+        if not checks:
+            raise ValueError("Must pass at least one of 'function', 'blueprint' or 'predicate'!")
+
+        self._rules.append((queue, lambda f, a, k: all(c(f, a, k) for c in checks)))
+
+        return self
+
+    def route(self, f: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        for queue, matches in self._rules:
+            if matches(f, args, kwargs):
+                return queue
+
+        return self._default
@@ -1,2 +1,3 @@
 from .base import BaseTask
 from .redis import RQTask
+from .cancellation import CancellationToken, TaskCancelled
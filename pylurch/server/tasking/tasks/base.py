@@ -1,8 +1,21 @@
-from typing import Dict, Callable, Tuple, Any
+import inspect
+from typing import Dict, Callable, Tuple, Any, Set
 from datetime import datetime
+from threading import RLock
+from time import monotonic
 from uuid import uuid4
 from pylurch.contract import enums as e, database as db
 from pyalfred.contract.client import Client
+from .cancellation import CancellationToken, LocalCancellationToken, TaskCancelled
+
+
+def accepts_argument(f: Callable[..., Any], name: str) -> bool:
+    try:
+        parameters = inspect.signature(f).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return (name in parameters) or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
 
 
 class FunctionDecorator(object):
@@ -12,13 +25,37 @@ class FunctionDecorator(object):
         self._include_task = include_task
 
     def __call__(self, *args, **kwargs):
+        token = self._task.token
+
+        if token.is_cancelled():
+            self._task.status = e.Status.Cancelled
+            return None
+
         try:
+            token.start(self._task.timeout)
             self._task.status = e.Status.Running
 
             if self._include_task:
                 kwargs["task_obj"] = self._task.db
 
-            return self._f(*args, **kwargs)
+            if accepts_argument(self._f, "cancel_token"):
+                kwargs["cancel_token"] = token
+
+            result = self._f(*args, **kwargs)
+
+            # NB: functions not taking the token may have been cancelled while running, we then drop their result
+            if token.is_cancelled():
+                self._task.status = e.Status.Cancelled
+                return None
+
+            self._task.status = e.Status.Done
+
+            return result
+
+        except TaskCancelled:
+            self._task.status = e.Status.Cancelled
+
+            return None
 
         except Exception as exc:
             self._task.fail(exc)
@@ -26,29 +63,96 @@ class FunctionDecorator(object):
             raise exc
 
 
+TERMINAL = (e.Status.Failed, e.Status.Done, e.Status.Cancelled)
+
+
 class BaseTask(object):
     def __init__(
-        self, f: Callable[[Tuple[Any], Dict[str, Any]], Any], client: Client, args=None, kwargs=None
+        self,
+        f: Callable[[Tuple[Any], Dict[str, Any]], Any],
+        client: Client,
+        args=None,
+        kwargs=None,
+        timeout: float = None,
+        flush_interval: float = 1.0,
     ):
         """
-        Defines a base class for tasks.
+        Defines a base class for tasks. If 'timeout' is passed, the task is stopped after running for as many seconds,
+        which for this class requires the task to check its cancellation token.
+
+        Changes to status and metadata are buffered and written at most every 'flush_interval' seconds, whereas
+        terminal statuses are always written immediately together with any pending metadata.
         """
 
+        self._function = f
         self._f = FunctionDecorator(f, self)
         self._args = args
         self._kwargs = kwargs
 
-        self._metas = dict()
+        self._metas = dict()  # type: Dict[str, db.TaskMeta]
 
         self._db = None  # type: db.Task
         self._client = client
 
-    def initialize(self, key: str = None):
-        task = db.Task(key=key or uuid4().hex, start_time=datetime.now(), end_time=datetime.max, status=e.Status.Queued)
+        self._flush_interval = flush_interval
+        self._last_flush = None  # type: float
+        self._dirty = False
+        self._dirty_metas = set()  # type: Set[str]
+        self._lock = RLock()
+
+        self._timeout = timeout
+        self._token = None  # type: CancellationToken
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+
+        return state
 
-        self._db = self._client.create(task)
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = RLock()
+
+    def make_db(self, key: str = None) -> db.Task:
+        return db.Task(key=key or uuid4().hex, start_time=datetime.now(), end_time=datetime.max, status=e.Status.Queued)
+
+    def bind(self, task: db.Task):
+        self._db = task
         return self
 
+    def initialize(self, key: str = None):
+        return self.bind(self._client.create(self.make_db(key)))
+
+    @property
+    def function(self) -> Callable[..., Any]:
+        return self._function
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, x: float):
+        self._timeout = x
+
+    @property
+    def flush_interval(self) -> float:
+        return self._flush_interval
+
+    @flush_interval.setter
+    def flush_interval(self, x: float):
+        self._flush_interval = x
+
+    @property
+    def token(self) -> CancellationToken:
+        if self._token is None:
+            self._token = self.make_token()
+
+        return self._token
+
+    def make_token(self) -> CancellationToken:
+        return LocalCancellationToken()
+
     @property
     def db(self) -> db.Task:
         return self._db
@@ -63,19 +167,32 @@ class BaseTask(object):
 
     @status.setter
     def status(self, x: e.Status):
-        self._db.status = x
+        with self._lock:
+            self._db.status = x
+
+            if x in TERMINAL:
+                self._db.end_time = datetime.now()
 
-        if x in (e.Status.Failed, e.Status.Done):
-            self._db.end_time = datetime.now()
+            self._dirty = True
 
-        self._db = self._client.update(self._db)[0]
+            if x in TERMINAL:
+                self.flush()
+            else:
+                self._maybe_flush()
+
+        self._notify(x)
+
+    def _notify(self, status: e.Status):
+        return
 
     def add_meta(self, key, value):
-        if key not in self._metas:
-            self._metas[key] = db.TaskMeta(task_id=self._db.id)
+        with self._lock:
+            if key not in self._metas:
+                self._metas[key] = db.TaskMeta(task_id=self._db.id)
 
-        self._metas[key].key = key
-        self._metas[key].value = value
+            self._metas[key].key = key
+            self._metas[key].value = value
+            self._dirty_metas.add(key)
 
         return self
 
@@ -86,12 +203,47 @@ class BaseTask(object):
 
         return self
 
+    def _maybe_flush(self):
+        if (self._last_flush is None) or (monotonic() - self._last_flush >= self._flush_interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Writes any pending changes of the task and its metadata, with new and existing metadata written in one batch
+        each.
+        """
+
+        with self._lock:
+            if self._dirty:
+                self._db = self._client.update(self._db)[0]
+                self._dirty = False
+
+            if self._dirty_metas:
+                keys = sorted(self._dirty_metas)
+
+                new = [k for k in keys if self._metas[k].id is None]
+                existing = [k for k in keys if self._metas[k].id is not None]
+
+                if new:
+                    created = self._client.create([self._metas[k] for k in new], batched=True)
+                    self._metas.update(zip(new, created))
+
+                if existing:
+                    updated = self._client.update([self._metas[k] for k in existing])
+                    self._metas.update(zip(existing, updated))
+
+                self._dirty_metas.clear()
+
+            self._last_flush = monotonic()
+
+        return self
+
     def update_meta(self):
-        # TODO: Improve
-        for k, v in self._metas.items():
-            if v.id is None:
-                self._metas[k] = self._client.create(v)
-            else:
-                self._metas[k] = self._client.update(v)
+        """
+        Writes pending metadata if 'flush_interval' has passed since the last write.
+        """
+
+        with self._lock:
+            self._maybe_flush()
 
         return self
@@ -0,0 +1,68 @@
+from threading import Event
+from time import monotonic
+from rq import get_current_job
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+def make_cancel_key(key: str) -> str:
+    return f"pylurch:cancel:{key}"
+
+
+class CancellationToken(object):
+    """
+    Passed to tasks accepting a 'cancel_token' argument, allowing long running tasks to stop when cancelled or timed
+    out by periodically calling 'raise_if_cancelled'.
+    """
+
+    def __init__(self):
+        self._deadline = None
+
+    def start(self, timeout: float = None):
+        self._deadline = None if timeout is None else monotonic() + timeout
+
+    @property
+    def timed_out(self) -> bool:
+        return (self._deadline is not None) and (monotonic() >= self._deadline)
+
+    def is_cancelled(self) -> bool:
+        raise NotImplementedError()
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled():
+            raise TaskCancelled("The task was cancelled!")
+
+        if self.timed_out:
+            raise TimeoutError("The task timed out!")
+
+
+class LocalCancellationToken(CancellationToken):
+    def __init__(self):
+        super().__init__()
+        self._event = Event()
+
+    def cancel(self):
+        self._event.set()
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+
+class RedisCancellationToken(CancellationToken):
+    def __init__(self, key: str):
+        """
+        Cancellation token for tasks run by 'RQ', cancelled by the existence of a key in Redis.
+        """
+
+        super().__init__()
+        self._key = key
+
+    def is_cancelled(self):
+        job = get_current_job()
+
+        if job is None:
+            return False
+
+        return job.connection.exists(make_cancel_key(self._key)) > 0
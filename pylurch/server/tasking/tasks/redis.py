@@ -1,7 +1,18 @@
-from rq import Queue
-from datetime import datetime
-from pylurch.contract import enums as e, database as db
+from rq import Queue, get_current_job
+from pylurch.contract import enums as e
 from .base import BaseTask
+from .cancellation import RedisCancellationToken
+
+
+WAIT_SAMPLES = 1_000
+
+
+def make_channel(key: str) -> str:
+    return f"pylurch:task:{key}"
+
+
+def make_wait_key(queue: str) -> str:
+    return f"pylurch:queue:{queue}:waits"
 
 
 class RQTask(BaseTask):
@@ -9,15 +20,47 @@ class RQTask(BaseTask):
     Class for tasking queues with 'RQ'.
     """
 
-    def __init__(self, f, client, args=None, kwargs=None):
-        super().__init__(f, client, args=args, kwargs=kwargs)
-        self._timeout = 2 * 3600
+    def __init__(
+        self,
+        f,
+        client,
+        args=None,
+        kwargs=None,
+        timeout: float = 2 * 3600,
+        flush_interval: float = 1.0,
+        queue: str = "default",
+    ):
+        super().__init__(f, client, args=args, kwargs=kwargs, timeout=timeout, flush_interval=flush_interval)
+        self._queue = queue
+
+    @property
+    def queue(self) -> str:
+        return self._queue
+
+    @queue.setter
+    def queue(self, x: str):
+        self._queue = x
 
     def make_rqtask(self, queue: Queue):
         return queue.create_job(self._f, args=self._args, kwargs=self._kwargs, timeout=self._timeout)
 
-    def initialize(self, key: str = None):
-        task = db.Task(key=key, start_time=datetime.now(), end_time=datetime.max, status=e.Status.Queued)
+    def make_token(self):
+        return RedisCancellationToken(self.key)
+
+    def _notify(self, status: e.Status):
+        job = get_current_job()
+
+        if job is None:
+            return
+
+        with job.connection.pipeline() as pipe:
+            pipe.publish(make_channel(self.key), status.value)
+
+            # NB: records the time spent in queue, trimmed to the latest samples
+            if (status == e.Status.Running) and (job.enqueued_at is not None) and (job.started_at is not None):
+                key = make_wait_key(job.origin)
+
+                pipe.lpush(key, (job.started_at - job.enqueued_at).total_seconds())
+                pipe.ltrim(key, 0, WAIT_SAMPLES - 1)
 
-        self._db = self._client.create(task)
-        return self
+            pipe.execute()
@@ -34,5 +34,8 @@ setup(
         "dill",
         "redis",
         "gitpython",
+        "requests",
+        "starlette",
     ],
+    extras_require={"arrow": ["pyarrow"]},
 )
@@ -0,0 +1,13 @@
+import pytest
+from .fakes import FakeClient
+
+
+@pytest.fixture
+def client():
+    return FakeClient()
+
+
+@pytest.fixture
+def conn():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeStrictRedis()
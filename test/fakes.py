@@ -0,0 +1,104 @@
+import itertools
+from threading import Lock
+from time import sleep
+from typing import Dict
+from uuid import uuid4
+from sqlalchemy import inspect
+
+# NB: clients are pickled together with the tasks of some runners, copies find their objects through the registry
+_REGISTRY = dict()  # type: Dict[str, dict]
+
+
+def _copy(obj):
+    # NB: the actual client returns new objects on every request, sharing them would hide missing updates
+    return type(obj)(**{a.key: getattr(obj, a.key) for a in inspect(type(obj)).column_attrs})
+
+
+class FakeClient(object):
+    def __init__(self, latency: float = 0.0):
+        """
+        In-memory stand-in for 'pyalfred.contract.client.Client', evaluating the filters on copies of the objects rather
+        than on the database. Every request sleeps for 'latency' seconds, mimicking the round trip to the server.
+        """
+
+        self._name = uuid4().hex
+        self._latency = latency
+        self._state = _REGISTRY[self._name] = {
+            "tables": dict(),
+            "ids": dict(),
+            "requests": 0,
+            "lock": Lock(),
+        }
+
+    def __getstate__(self):
+        return {"_name": self._name, "_latency": self._latency}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._state = _REGISTRY[self._name]
+
+    @property
+    def requests(self) -> int:
+        return self._state["requests"]
+
+    @property
+    def _lock(self) -> Lock:
+        return self._state["lock"]
+
+    def _request(self):
+        self._state["requests"] += 1
+
+        if self._latency > 0.0:
+            sleep(self._latency)
+
+    def _table(self, cls) -> dict:
+        return self._state["tables"].setdefault(cls.__table__.name, dict())
+
+    def create(self, obj, batched=False):
+        self._request()
+
+        objs = obj if isinstance(obj, (list, tuple)) else [obj]
+
+        with self._lock:
+            for o in objs:
+                if o.id is None:
+                    o.id = next(self._state["ids"].setdefault(type(o).__table__.name, itertools.count(1)))
+
+                self._table(type(o))[o.id] = _copy(o)
+
+        return list(objs) if isinstance(obj, (list, tuple)) else obj
+
+    def update(self, obj):
+        self._request()
+
+        objs = obj if isinstance(obj, (list, tuple)) else [obj]
+
+        with self._lock:
+            for o in objs:
+                self._table(type(o))[o.id] = _copy(o)
+
+        return list(objs)
+
+    def delete(self, obj):
+        self._request()
+
+        objs = obj if isinstance(obj, (list, tuple)) else [obj]
+
+        with self._lock:
+            for o in objs:
+                self._table(type(o)).pop(o.id, None)
+
+        return len(objs)
+
+    def get(self, cls, f=None, one=False, operations=None):
+        self._request()
+
+        with self._lock:
+            rows = [o for o in self._table(cls).values() if (f is None) or f(o)]
+
+        rows.sort(key=lambda o: o.id, reverse="desc" in (operations or ""))
+
+        if one or ("first" in (operations or "")):
+            return _copy(rows[0]) if rows else None
+
+        return [_copy(o) for o in rows]
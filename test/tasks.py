@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+from pylurch.contract.enums import Status
+
+
+def double(x, task_obj=None):
+    return 2 * x
+
+
+def fail(task_obj=None):
+    raise ValueError("Failed on purpose")
+
+
+def spin(seconds, task_obj=None, cancel_token=None):
+    stop = time.monotonic() + seconds
+
+    while time.monotonic() < stop:
+        cancel_token.raise_if_cancelled()
+        time.sleep(0.005)
+
+    return seconds
+
+
+def sleep_for(seconds, task_obj=None):
+    time.sleep(seconds)
+    return seconds
+
+
+def unpicklable(task_obj=None):
+    return threading.Lock()
+
+
+async def double_async(x, task_obj=None):
+    await asyncio.sleep(0.01)
+    return 2 * x
+
+
+async def fail_async(task_obj=None):
+    await asyncio.sleep(0.01)
+    raise ValueError("Failed on purpose")
+
+
+def block(runner, f=spin, seconds=5.0):
+    """
+    Enqueues 'f' and waits for it to start running, occupying a worker of 'runner'.
+    """
+
+    key = runner.enqueue(f, seconds)
+
+    while runner.check_status(key) != Status.Running:
+        time.sleep(0.005)
+
+    return key
+
+
+def work(runner, conn):
+    from rq import SimpleWorker
+
+    SimpleWorker(runner.queues, connection=conn).work(burst=True, logging_level="WARNING")
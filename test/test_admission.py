@@ -0,0 +1,118 @@
+import time
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from concurrent.futures import ThreadPoolExecutor
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.admission import AdmissionPolicy, Overflow, TaskRejected
+from pylurch.server.tasking.runners import ExecutorRunner, RQRunner
+from pylurch.server.tasking.runners.routing import Router
+from .tasks import double, fail, block
+
+
+class TestAdmissionPolicy(object):
+    def test_depth(self):
+        policy = AdmissionPolicy(max_depth=2)
+
+        assert not policy.is_full(1, 0.0)
+        assert policy.is_full(2, 0.0)
+        assert policy.is_full(1, 0.0, incoming=2)
+
+    def test_wait(self):
+        policy = AdmissionPolicy(max_wait=1.0)
+
+        assert not policy.is_full(1, 0.5)
+        assert policy.is_full(1, 2.0)
+
+        # NB: an empty queue has no wait, whatever the age reported
+        assert not policy.is_full(0, 2.0)
+
+    def test_fits(self):
+        assert AdmissionPolicy().fits(1_000)
+        assert AdmissionPolicy(max_depth=2).fits(2)
+        assert not AdmissionPolicy(max_depth=2).fits(3)
+
+    def test_rejection(self):
+        exc = TaskRejected("default", 10, 1.5)
+
+        assert (exc.queue, exc.depth, exc.wait) == ("default", 10, 1.5)
+        assert "default" in str(exc)
+
+
+class TestExecutorRunner(object):
+    def test_reject(self, client):
+        runner = ExecutorRunner(client, executor=ThreadPoolExecutor(1), admission=AdmissionPolicy(max_depth=1))
+        blocker = block(runner)
+
+        runner.enqueue(double, 1)
+
+        with pytest.raises(TaskRejected):
+            runner.enqueue(double, 2)
+
+        runner.cancel(blocker)
+
+    def test_reject_batch_exceeding_depth(self, client):
+        runner = ExecutorRunner(client, admission=AdmissionPolicy(max_depth=2, overflow=Overflow.DropOldest))
+
+        with pytest.raises(TaskRejected):
+            runner.enqueue_many(double, [(i,) for i in range(3)])
+
+    def test_drop_oldest(self, client):
+        policy = AdmissionPolicy(max_depth=1, overflow=Overflow.DropOldest)
+        runner = ExecutorRunner(client, executor=ThreadPoolExecutor(1), admission=policy)
+        blocker = block(runner)
+
+        first = runner.enqueue(double, 1)
+        second = runner.enqueue(double, 2)
+
+        assert runner.check_status(first) == Status.Cancelled
+
+        runner.cancel(blocker)
+
+        assert runner.wait(second, 5.0) == Status.Done
+
+    def test_reject_on_wait(self, client):
+        runner = ExecutorRunner(client, executor=ThreadPoolExecutor(1), admission=AdmissionPolicy(max_wait=0.05))
+        blocker = block(runner)
+
+        runner.enqueue(double, 1)
+        time.sleep(0.1)
+
+        with pytest.raises(TaskRejected):
+            runner.enqueue(double, 2)
+
+        runner.cancel(blocker)
+
+
+class TestRQRunner(object):
+    def test_reject(self, conn, client):
+        runner = RQRunner(conn, client, admission=AdmissionPolicy(max_depth=1))
+        runner.enqueue(double, 1)
+
+        with pytest.raises(TaskRejected):
+            runner.enqueue(double, 2)
+
+    def test_policy_per_queue(self, conn, client):
+        router = Router().add("fast", function=double)
+        runner = RQRunner(conn, client, router=router, admission={"fast": AdmissionPolicy(max_depth=1)})
+
+        runner.enqueue(double, 1)
+
+        with pytest.raises(TaskRejected) as info:
+            runner.enqueue(double, 2)
+
+        assert info.value.queue == "fast"
+
+        runner.enqueue_many(fail, [()] * 3)
+
+        assert runner.depth("default") == 3
+
+    def test_drop_oldest(self, conn, client):
+        runner = RQRunner(conn, client, admission=AdmissionPolicy(max_depth=1, overflow=Overflow.DropOldest))
+
+        first = runner.enqueue(double, 1)
+        runner.enqueue(double, 2)
+
+        assert runner.check_status(first) == Status.Cancelled
+        assert runner.depth() == 1
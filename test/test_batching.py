@@ -0,0 +1,131 @@
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract.enums import Backend
+from pylurch.inference import InferenceModelBlueprint, LoadedContainer
+from pylurch.inference.batching import MicroBatcher
+from pylurch.inference.cache import ModelCache
+from pylurch.inference.sessionmanager import SessionManager
+
+
+class SumBlueprint(InferenceModelBlueprint):
+    def __init__(self):
+        super().__init__()
+        self.calls = list()
+
+    def name(self):
+        return "sum"
+
+    def predict(self, container, x, **kwargs):
+        self.calls.append(len(x))
+
+        if isinstance(x, pd.DataFrame):
+            return pd.DataFrame({"y": x.sum(axis=1)}, index=x.index)
+
+        return x.sum(axis=1, keepdims=True)
+
+
+def _concurrently(f, inputs):
+    results = [None] * len(inputs)
+    barrier = threading.Barrier(len(inputs))
+
+    def run(i):
+        barrier.wait()
+        results[i] = f(inputs[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(inputs))]
+
+    for t in threads:
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    return results
+
+
+class TestMicroBatcher(object):
+    @pytest.fixture
+    def blueprint(self):
+        return SumBlueprint()
+
+    def test_splits_frames_and_keeps_index(self, blueprint):
+        batcher = MicroBatcher(blueprint, LoadedContainer(None, Backend.ONNX), max_wait=0.1)
+
+        inputs = [
+            pd.DataFrame(np.random.rand(i + 1, 3), index=[f"{i}-{j}" for j in range(i + 1)], columns=list("abc"))
+            for i in range(8)
+        ]
+
+        try:
+            results = _concurrently(batcher.predict, inputs)
+        finally:
+            batcher.close()
+
+        for x, result in zip(inputs, results):
+            assert list(result.index) == list(x.index)
+            assert np.allclose(result["y"], x.sum(axis=1))
+
+        assert len(blueprint.calls) < len(inputs)
+        assert sum(blueprint.calls) == sum(len(x) for x in inputs)
+
+    def test_splits_arrays(self, blueprint):
+        batcher = MicroBatcher(blueprint, LoadedContainer(None, Backend.ONNX), max_wait=0.1)
+        inputs = [np.random.rand(i + 1, 3) for i in range(8)]
+
+        try:
+            results = _concurrently(batcher.predict, inputs)
+        finally:
+            batcher.close()
+
+        for x, result in zip(inputs, results):
+            assert np.allclose(result, x.sum(axis=1, keepdims=True))
+
+    def test_caps_batch_size(self, blueprint):
+        batcher = MicroBatcher(blueprint, LoadedContainer(None, Backend.ONNX), max_batch_size=4, max_wait=0.1)
+
+        try:
+            _concurrently(batcher.predict, [np.ones((2, 3)) for _ in range(8)])
+        finally:
+            batcher.close()
+
+        assert max(blueprint.calls) <= 4
+
+    def test_predicts_directly_once_closed(self, blueprint):
+        batcher = MicroBatcher(blueprint, LoadedContainer(None, Backend.ONNX))
+        batcher.close()
+
+        assert np.allclose(batcher.predict(np.ones((2, 3))), 3.0)
+
+
+class TestSessionManagerBatchers(object):
+    @staticmethod
+    def _load(cache, session_id):
+        return cache.get_or_load(session_id, lambda: (LoadedContainer(None, Backend.ONNX), 1))
+
+    def test_closes_batchers_of_evicted_models(self):
+        cache = ModelCache(max_entries=1)
+        manager = SessionManager(None, SumBlueprint(), cache=cache, batching=dict())
+
+        batcher = manager._get_batcher(1, self._load(cache, 1))
+        batcher.predict(np.ones((1, 3)))
+
+        manager._get_batcher(2, self._load(cache, 2))
+
+        assert list(manager.batchers) == [2]
+        assert batcher._thread is None
+
+        cache.clear()
+
+        assert not manager.batchers
+
+    def test_does_not_batch_uncached_models(self):
+        cache = ModelCache(max_bytes=0)
+        manager = SessionManager(None, SumBlueprint(), cache=cache, batching=dict())
+
+        assert manager._get_batcher(1, self._load(cache, 1)) is None
+        assert not manager.batchers
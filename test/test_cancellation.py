@@ -0,0 +1,103 @@
+import asyncio
+import time
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from concurrent.futures import ThreadPoolExecutor
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import ExecutorRunner, ProcessPoolRunner, AsyncioRunner, RQRunner
+from .tasks import double, spin, sleep_for, block
+
+
+async def sleep_async(seconds, task_obj=None):
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+@pytest.fixture
+def runner(client):
+    return ExecutorRunner(client, executor=ThreadPoolExecutor(1))
+
+
+class TestExecutorRunner(object):
+    def test_cancel_queued(self, runner):
+        blocker = block(runner)
+        key = runner.enqueue(double, 1)
+
+        assert runner.cancel(key)
+        assert runner.wait(key, 5.0) == Status.Cancelled
+        assert runner.get_result(key) is None
+
+        runner.cancel(blocker)
+
+    def test_cancel_running(self, runner):
+        key = block(runner)
+
+        assert runner.cancel(key)
+        assert runner.wait(key, 5.0) == Status.Cancelled
+        assert not runner.cancel(key)
+
+    def test_cancel_running_without_token(self, runner):
+        key = block(runner, sleep_for, 0.2)
+
+        assert runner.cancel(key)
+        assert runner.wait(key, 5.0) == Status.Cancelled
+        assert runner.check_status(key) == Status.Cancelled
+        assert runner.get_result(key) is None
+
+    def test_timeout(self, runner):
+        key = runner.enqueue_with(spin, args=(5.0,), timeout=0.05)
+
+        start = time.monotonic()
+
+        assert runner.wait(key, 5.0) == Status.Failed
+        assert time.monotonic() - start < 2.0
+        assert runner.get_exception(key).type_ == "TimeoutError"
+
+    def test_timeout_requires_cancel_token(self, runner):
+        with pytest.raises(TypeError):
+            runner.enqueue_with(sleep_for, args=(0.1,), timeout=0.05)
+
+
+class TestProcessPoolRunner(object):
+    def test_cancel_running(self, client):
+        runner = ProcessPoolRunner(client, max_workers=1)
+        key = runner.enqueue(sleep_for, 0.2)
+
+        assert runner.cancel(key)
+        assert runner.wait(key, 30.0) == Status.Cancelled
+        assert runner.check_status(key) == Status.Cancelled
+        assert runner.get_result(key) is None
+
+    def test_timeout(self, client):
+        runner = ProcessPoolRunner(client, max_workers=1)
+
+        # NB: gives the pool time to spin up its worker before timing the task
+        runner.wait(runner.enqueue(double, 1), 30.0)
+
+        key = runner.enqueue_with(sleep_for, args=(1.0,), timeout=0.05)
+
+        assert runner.wait(key, 0.5) == Status.Failed
+        assert runner.get_exception(key).type_ == "TimeoutError"
+
+
+class TestAsyncioRunner(object):
+    def test_cancel_running_without_token(self, client):
+        runner = AsyncioRunner(client)
+        key = block(runner, sleep_async, 0.2)
+
+        assert runner.cancel(key)
+        assert runner.wait(key, 5.0) == Status.Cancelled
+        assert runner.check_status(key) == Status.Cancelled
+        assert runner.get_result(key) is None
+
+
+class TestRQRunner(object):
+    def test_cancel_queued(self, conn, client):
+        runner = RQRunner(conn, client)
+        key = runner.enqueue(double, 1)
+
+        assert runner.cancel(key)
+        assert runner.depth() == 0
+        assert runner.wait(key, 1.0) == Status.Cancelled
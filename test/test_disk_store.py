@@ -0,0 +1,59 @@
+import os
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract.storage import DiskArtifactStore, hash_bytes
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DiskArtifactStore(str(tmp_path))
+
+
+class TestDiskArtifactStore(object):
+    def test_roundtrip(self, store):
+        key = store.put(b"model")
+
+        assert key == hash_bytes(b"model")
+        assert bytes(store.get(key)) == b"model"
+        assert store.locate(key) == store.path(key)
+
+    def test_empty(self, store):
+        key = store.put(b"")
+
+        assert bytes(store.get(key)) == b""
+
+    def test_counts_references(self, store):
+        key = store.put(b"model")
+
+        assert store.put(b"model") == key
+        assert store.references(key) == 2
+
+        assert not store.delete(key)
+        assert store.exists(key)
+        assert store.references(key) == 1
+
+        assert store.delete(key)
+        assert not store.exists(key)
+        assert store.locate(key) is None
+        assert store.references(key) == 0
+
+    def test_delete_missing(self, store):
+        assert not store.delete(hash_bytes(b"missing"))
+
+    def test_legacy_content_counts_once(self, store):
+        key = store.put(b"model")
+        os.remove(f"{store.path(key)}.refs")
+
+        assert store.references(key) == 1
+        assert store.delete(key)
+        assert not store.exists(key)
+
+    def test_put_after_delete(self, store):
+        key = store.put(b"model")
+        store.delete(key)
+
+        assert store.put(b"model") == key
+        assert bytes(store.get(key)) == b"model"
+        assert store.references(key) == 1
@@ -0,0 +1,51 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from concurrent.futures import ThreadPoolExecutor
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import ExecutorRunner, RQRunner
+from .tasks import double, work, block
+
+
+class TestEnqueueMany(object):
+    def test_executor(self, client):
+        runner = ExecutorRunner(client)
+        keys = runner.enqueue_many(double, [(i,) for i in range(10)])
+
+        assert [runner.wait(k, 5.0) for k in keys] == [Status.Done] * 10
+        assert [runner.get_result(k) for k in keys] == [2 * i for i in range(10)]
+
+    def test_creates_rows_in_one_request(self, client, monkeypatch):
+        created = list()
+        create = client.create
+
+        def spy(obj, batched=False):
+            created.append(obj)
+            return create(obj, batched=batched)
+
+        monkeypatch.setattr(client, "create", spy)
+
+        runner = ExecutorRunner(client, executor=ThreadPoolExecutor(1))
+        blocker = block(runner)
+
+        created.clear()
+        runner.enqueue_many(double, [(i,) for i in range(10)])
+
+        assert len(created) == 1
+        assert len(created[0]) == 10
+
+        runner.cancel(blocker)
+
+    def test_rq(self, conn, client):
+        runner = RQRunner(conn, client)
+        keys = runner.enqueue_many(double, [(i,) for i in range(10)])
+
+        assert runner.depth() == 10
+
+        work(runner, conn)
+
+        assert [runner.get_result(k) for k in keys] == [2 * i for i in range(10)]
+
+    def test_empty(self, client):
+        assert ExecutorRunner(client).enqueue_many(double, []) == []
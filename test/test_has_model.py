@@ -0,0 +1,93 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from pylurch.contract import database as db
+from pylurch.contract.enums import ArtifactType, Backend
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    db.Base.metadata.create_all(engine)
+
+    session = Session(engine)
+
+    model = db.Model(name="m", revision="1")
+    session.add(model)
+    session.flush()
+
+    session.add_all([db.TrainingSession(model_id=model.id, name="s", version=i, has_model=False) for i in range(3)])
+    session.commit()
+
+    yield session
+
+    session.close()
+
+
+def _flags(session):
+    return [s.has_model for s in session.query(db.TrainingSession).order_by(db.TrainingSession.id)]
+
+
+def _artifact(session_id, type_=ArtifactType.Model):
+    return db.Artifact(session_id=session_id, type_=type_, backend=Backend.ONNX, bytes=b"")
+
+
+class TestHasModel(object):
+    def test_insert_and_delete(self, session):
+        artifact = _artifact(1)
+
+        session.add(artifact)
+        session.add(_artifact(2, ArtifactType.State))
+        session.commit()
+
+        assert _flags(session) == [True, False, False]
+
+        session.delete(artifact)
+        session.commit()
+
+        assert _flags(session) == [False, False, False]
+
+    def test_move(self, session):
+        artifact = _artifact(1)
+        session.add(artifact)
+        session.flush()
+
+        artifact.session_id = 2
+        session.flush()
+
+        assert _flags(session) == [False, True, False]
+
+    def test_move_expired(self, session):
+        artifact = _artifact(1)
+        session.add(artifact)
+        session.commit()
+
+        # NB: instances are expired on commit, so the previous value is not loaded when changed
+        artifact.session_id = 2
+        session.commit()
+
+        assert _flags(session) == [False, True, False]
+
+    def test_retype_expired(self, session):
+        artifact = _artifact(1)
+        session.add(artifact)
+        session.commit()
+
+        artifact.type_ = ArtifactType.State
+        session.commit()
+
+        assert _flags(session) == [False, False, False]
+
+    def test_backfill(self, session):
+        session.bulk_save_objects([_artifact(3)])
+        session.commit()
+
+        assert _flags(session) == [False, False, False]
+        assert db.backfill_has_model(session.connection()) == 3
+
+        session.commit()
+
+        assert _flags(session) == [False, False, True]
@@ -0,0 +1,79 @@
+import threading
+import time
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.inference.cache import ModelCache
+
+
+class TestModelCache(object):
+    def test_evicts_least_recently_used(self):
+        cache = ModelCache(max_entries=2)
+
+        for k in "abc":
+            cache.get_or_load(k, lambda: (k, 1))
+
+            if k == "b":
+                cache.get("a")
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("a", None, "c")
+        assert cache.stats()["evictions"] == 1
+
+    def test_evicts_on_bytes(self):
+        cache = ModelCache(max_bytes=10)
+
+        cache.get_or_load("a", lambda: ("a", 6))
+        cache.get_or_load("b", lambda: ("b", 6))
+        cache.get_or_load("c", lambda: ("c", 11))
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (None, "b", None)
+        assert cache.nbytes == 6
+
+    def test_collapses_concurrent_loads(self):
+        cache = ModelCache()
+        calls = list()
+        started = threading.Event()
+
+        def load():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+
+            return object(), 1
+
+        results = list()
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("a", load))) for _ in range(8)]
+
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len(set(map(id, results))) == 1
+
+    def test_failed_load_is_not_cached(self):
+        cache = ModelCache()
+
+        def fail():
+            raise ValueError()
+
+        with pytest.raises(ValueError):
+            cache.get_or_load("a", fail)
+
+        assert cache.get_or_load("a", lambda: ("a", 1)) == "a"
+
+    def test_notifies_listeners(self):
+        cache = ModelCache(max_entries=1, max_bytes=10)
+        removed = list()
+
+        cache.add_eviction_listener(lambda k, c: removed.append((k, c)))
+
+        cache.get_or_load("a", lambda: ("a", 1))
+        cache.get_or_load("b", lambda: ("b", 1))
+        cache.get_or_load("c", lambda: ("c", 11))
+        cache.invalidate("b")
+
+        assert removed == [("a", "a"), ("c", "c"), ("b", "b")]
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyalfred")
+pytest.importorskip("skl2onnx")
+
+from example.models.regression import LinearRegressionBlueprint
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    x = pd.DataFrame(np.random.rand(100, 3).astype(np.float32), columns=list("abc"), index=np.arange(100) + 10)
+    y = x.sum(axis=1)
+
+    blueprint = LinearRegressionBlueprint()
+    container = blueprint.fit(blueprint.make_model(), x, y)
+
+    return blueprint, blueprint.deserialize(blueprint.serialize(container, x=x, y=y)), x
+
+
+class TestPredict(object):
+    def test_frame_keeps_index(self, fitted):
+        blueprint, container, x = fitted
+        result = blueprint.predict(container, x)
+
+        assert list(result.index) == list(x.index)
+        assert np.allclose(result["y"], x.sum(axis=1), atol=1e-4)
+
+    def test_array(self, fitted):
+        blueprint, container, x = fitted
+        result = blueprint.predict(container, x.to_numpy())
+
+        assert np.allclose(result.ravel(), x.sum(axis=1), atol=1e-4)
+
+    def test_binds_output(self, fitted):
+        blueprint, container, x = fitted
+        out = np.empty((len(x), 1), dtype=np.float32)
+
+        assert blueprint.predict(container, x.to_numpy(), out=out) is out
+        assert np.allclose(out.ravel(), x.sum(axis=1), atol=1e-4)
+
+    @pytest.mark.parametrize(
+        "out",
+        [np.zeros((100, 2), dtype=np.float32)[:, :1], np.zeros((100, 1), dtype=np.float64)],
+        ids=["strided", "dtype"],
+    )
+    def test_copies_to_unbindable_output(self, fitted, out):
+        blueprint, container, x = fitted
+
+        assert blueprint.predict(container, x.to_numpy(), out=out) is out
+        assert np.allclose(out.ravel(), x.sum(axis=1), atol=1e-4)
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.inference.results import PredictionCache
+
+
+class TestPredictionCache(object):
+    @staticmethod
+    def _predict(calls):
+        def f(x):
+            calls.append(len(x))
+            return pd.DataFrame({"y": x.sum(axis=1)}, index=x.index)
+
+        return f
+
+    def test_only_predicts_missing_rows(self):
+        cache = PredictionCache()
+        calls = list()
+
+        x = pd.DataFrame(np.arange(12.0).reshape(6, 2), columns=["a", "b"])
+
+        first = cache.predict(1, "t", x.iloc[:4], self._predict(calls))
+        second = cache.predict(1, "t", x, self._predict(calls))
+
+        assert calls == [4, 2]
+        assert list(second.columns) == ["y"]
+        assert np.allclose(second["y"], x.sum(axis=1))
+        assert np.allclose(first["y"], second["y"].iloc[:4])
+        assert cache.stats()["hits"] == 4
+
+    def test_keyed_on_token(self):
+        cache = PredictionCache()
+        calls = list()
+
+        x = pd.DataFrame(np.ones((3, 2)), columns=["a", "b"])
+
+        cache.predict(1, "t", x, self._predict(calls))
+        cache.predict(1, "u", x, self._predict(calls))
+
+        assert calls == [3, 3]
+
+    def test_invalidate(self):
+        cache = PredictionCache()
+        calls = list()
+
+        x = pd.DataFrame(np.ones((3, 2)), columns=["a", "b"])
+
+        cache.predict(1, "t", x, self._predict(calls))
+
+        assert cache.invalidate(1) == 1
+
+        cache.predict(1, "t", x, self._predict(calls))
+
+        assert calls == [3, 3]
@@ -0,0 +1,94 @@
+import os
+import threading
+import time
+import numpy as np
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.results import SpillingResultStore
+from pylurch.server.tasking.runners import ExecutorRunner
+from .tasks import unpicklable
+
+
+class TestSpillingResultStore(object):
+    def test_roundtrip(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path))
+        store.put("a", {"x": 1})
+
+        assert store.get("a") == {"x": 1}
+        assert store.open("a").read()
+        assert store.get("b", "missing") == "missing"
+
+    def test_spills_large_results(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path), spill_threshold=1_000)
+        store.put("a", np.zeros(1_000))
+
+        assert store.stats()["spills"] == 1
+        assert os.path.exists(os.path.join(str(tmp_path), "a"))
+        assert (store.get("a") == 0.0).all()
+
+    def test_spills_least_recently_used(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path), max_memory_bytes=3_500)
+
+        for k in "abc":
+            store.put(k, b"x" * 1_000)
+
+        store.get("a")
+        store.put("d", b"x" * 1_000)
+
+        assert os.listdir(str(tmp_path)) == ["b"]
+        assert store.get("b") == b"x" * 1_000
+
+    def test_evicts_from_disk(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path), max_disk_bytes=2_500, spill_threshold=0)
+
+        for k in "abc":
+            store.put(k, b"x" * 1_000)
+
+        assert store.get("a") is None
+        assert store.stats()["evictions"] == 1
+
+    def test_expires(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path), ttl=0.05)
+        store.put("a", 1)
+
+        time.sleep(0.1)
+        store.put("b", 2)
+
+        assert store.get("a") is None
+        assert store.stats()["entries"] == 1
+
+    def test_expire_returns_freed_bytes(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path))
+        store.put("a", b"x" * 1_000)
+
+        assert store.expire(["a", "b"]) > 1_000
+        assert store.stats()["memory_bytes"] == 0
+
+    def test_unpicklable(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path))
+        lock = threading.Lock()
+
+        store.put("a", lock)
+
+        assert store.get("a") is lock
+
+        with pytest.raises(TypeError):
+            store.open("a")
+
+    def test_replaces(self, tmp_path):
+        store = SpillingResultStore(str(tmp_path), spill_threshold=10)
+        store.put("a", b"x" * 1_000)
+        store.put("a", 1)
+
+        assert store.get("a") == 1
+        assert store.stats()["disk_bytes"] == 0
+
+    def test_runner_keeps_unpicklable_results(self, client):
+        runner = ExecutorRunner(client)
+        key = runner.enqueue(unpicklable)
+
+        assert runner.wait(key, 5.0) == Status.Done
+        assert runner.get_result(key) is not None
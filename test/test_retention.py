@@ -0,0 +1,160 @@
+import gzip
+import json
+import pickle
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from datetime import datetime, timedelta
+from pylurch.contract import database as db
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.retention import prune_tasks, JsonLinesArchive
+from pylurch.server.tasking.runners import ExecutorRunner
+from .tasks import double
+
+
+def make_task(client, key, status=Status.Done, age=None):
+    end_time = datetime.max if age is None else datetime.now() - age
+    task = client.create(db.Task(key=key, start_time=datetime.now(), end_time=end_time, status=status))
+
+    client.create(db.TaskMeta(task_id=task.id, key="progress", value="1.0"))
+
+    if status == Status.Failed:
+        client.create(db.TaskException(task_id=task.id, type_="ValueError", message="Failed on purpose"))
+
+    return task
+
+
+@pytest.fixture
+def tasks(client):
+    """
+    Creates, in order, ten old finished tasks of which every third failed, a recent one and a queued one.
+    """
+
+    old = timedelta(days=2)
+    result = [make_task(client, f"old-{i}", Status.Failed if i % 3 == 0 else Status.Done, old) for i in range(10)]
+
+    result.append(make_task(client, "recent", age=timedelta(minutes=1)))
+    result.append(make_task(client, "queued", Status.Queued))
+
+    return result
+
+
+def keys(client, cls=db.Task):
+    return sorted(t.key for t in client.get(cls))
+
+
+class TestPruneTasks(object):
+    def test_deletes_old_tasks(self, client, tasks):
+        report = prune_tasks(client, timedelta(days=1), batch_size=3)
+
+        assert keys(client) == ["queued", "recent"]
+        assert (report.tasks, report.metas, report.exceptions) == (10, 10, 4)
+        assert report.rows == 24
+        assert report.row_bytes > 0
+
+        remaining = {t.id for t in client.get(db.Task)}
+
+        assert {m.task_id for m in client.get(db.TaskMeta)} == remaining
+        assert client.get(db.TaskException) == []
+
+    def test_archives_and_expires_per_batch(self, client, tasks):
+        archived = list()
+        expired = list()
+
+        def archive(batch, metas, exceptions):
+            archived.append(([t.key for t in batch], len(metas), len(exceptions)))
+
+        def expire(batch_keys):
+            expired.append(list(batch_keys))
+            return 100
+
+        report = prune_tasks(client, timedelta(days=1), batch_size=4, archive=archive, expire=expire)
+
+        assert [a[0] for a in archived] == [[f"old-{i}" for i in range(j, min(j + 4, 10))] for j in (0, 4, 8)]
+        assert [(a[1], a[2]) for a in archived] == [(4, 2), (4, 1), (2, 1)]
+        assert expired == [a[0] for a in archived]
+        assert report.result_bytes == 300
+        assert report.bytes == report.row_bytes + 300
+
+    def test_limits_queries_to_batch_size(self, client, tasks, monkeypatch):
+        sizes = list()
+        get = client.get
+
+        def spy(cls, f=None, one=False, operations=None):
+            result = get(cls, f, one=one, operations=operations)
+
+            if (cls is db.Task) and not one:
+                sizes.append(len(result))
+
+            return result
+
+        monkeypatch.setattr(client, "get", spy)
+        prune_tasks(client, timedelta(days=1), batch_size=3)
+
+        assert sizes == [3, 3, 3, 1]
+
+    def test_skips_empty_windows(self, client, tasks):
+        archived = list()
+
+        # NB: leaves a hole of ids in the middle of the range to prune
+        for t in tasks[3:7]:
+            t.end_time = datetime.max
+            client.update(t)
+
+        prune_tasks(client, timedelta(days=1), batch_size=2, archive=lambda *u: archived.append(len(u[0])))
+
+        assert archived == [2, 1, 1, 2]
+        assert keys(client) == ["old-3", "old-4", "old-5", "old-6", "queued", "recent"]
+
+    def test_nothing_to_prune(self, client, tasks):
+        report = prune_tasks(client, timedelta(days=7))
+
+        assert report.rows == 0
+        assert len(client.get(db.Task)) == len(tasks)
+
+    def test_checks_cancellation_between_batches(self, client, tasks):
+        class Token(object):
+            def __init__(self):
+                self.checks = 0
+
+            def raise_if_cancelled(self):
+                self.checks += 1
+
+                if self.checks > 1:
+                    raise TimeoutError()
+
+        with pytest.raises(TimeoutError):
+            prune_tasks(client, timedelta(days=1), batch_size=4, cancel_token=Token())
+
+        assert len(client.get(db.Task)) == len(tasks) - 4
+
+
+class TestJsonLinesArchive(object):
+    def test_writes_tasks(self, client, tasks, tmp_path):
+        path = str(tmp_path / "archive.jsonl.gz")
+        archive = pickle.loads(pickle.dumps(JsonLinesArchive(path)))
+
+        prune_tasks(client, timedelta(days=1), batch_size=4, archive=archive)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+
+        assert [r["key"] for r in rows] == [f"old-{i}" for i in range(10)]
+        assert rows[0]["status"] == Status.Failed.value
+        assert rows[0]["meta"] == {"progress": "1.0"}
+        assert rows[0]["exceptions"] == [{"type": "ValueError", "message": "Failed on purpose"}]
+        assert rows[1]["exceptions"] == []
+
+
+class TestRunner(object):
+    def test_prune_expires_results(self, client):
+        runner = ExecutorRunner(client)
+        key = runner.enqueue(double, 1)
+
+        assert runner.wait(key, 5.0) == Status.Done
+
+        report = runner.prune(timedelta(seconds=-1))
+
+        assert report.tasks == 1
+        assert runner.get_result(key) is None
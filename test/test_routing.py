@@ -0,0 +1,106 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.inference.blueprint import InferenceModelBlueprint
+from pylurch.server.tasking.runners import RQRunner
+from pylurch.server.tasking.runners.routing import Router
+from .tasks import double, fail, work
+
+
+class NamedBlueprint(InferenceModelBlueprint):
+    def __init__(self, name):
+        super().__init__()
+        self._name = name
+
+    def name(self):
+        return self._name
+
+
+class TestRouter(object):
+    def test_default(self):
+        assert Router().route(double, (1,), dict()) == "default"
+        assert Router(default="slow").route(double, (1,), dict()) == "slow"
+
+    def test_function(self):
+        router = Router().add("fast", function=double).add("named", function=fail.__qualname__)
+
+        assert router.route(double, (1,), dict()) == "fast"
+        assert router.route(fail, (), dict()) == "named"
+
+    def test_blueprint(self):
+        router = Router().add("gpu", blueprint="large")
+
+        assert router.route(double, (NamedBlueprint("large"),), dict()) == "gpu"
+        assert router.route(double, (), {"blueprint": NamedBlueprint("large")}) == "gpu"
+        assert router.route(double, (NamedBlueprint("small"),), dict()) == "default"
+
+    def test_all_checks_must_match(self):
+        router = Router().add("gpu", function=double, predicate=lambda f, a, k: a[0] > 10)
+
+        assert router.route(double, (11,), dict()) == "gpu"
+        assert router.route(double, (1,), dict()) == "default"
+        assert router.route(fail, (11,), dict()) == "default"
+
+    def test_first_match_wins(self):
+        router = Router().add("first", function=double).add("second", function=double)
+
+        assert router.route(double, (1,), dict()) == "first"
+
+    def test_queues(self):
+        router = Router().add("fast", function=double).add("slow", function=fail).add("fast", blueprint="large")
+
+        assert router.queues == ("default", "fast", "slow")
+
+    def test_requires_check(self):
+        with pytest.raises(ValueError):
+            Router().add("fast")
+
+
+class TestRQRunner(object):
+    def test_routing(self, conn, client):
+        runner = RQRunner(conn, client, queues=["fast"], router=Router().add("fast", function=double))
+        runner.enqueue(double, 1)
+        runner.enqueue(fail)
+
+        assert [q.name for q in runner.queues] == ["fast", "default"]
+        assert (runner.depth("fast"), runner.depth("default")) == (1, 1)
+
+    def test_enqueue_many_routes_per_task(self, conn, client):
+        runner = RQRunner(conn, client, router=Router().add("large", predicate=lambda f, a, k: a[0] >= 5))
+        runner.enqueue_many(double, [(i,) for i in range(10)])
+
+        assert (runner.depth("default"), runner.depth("large")) == (5, 5)
+
+    def test_queue_option(self, conn, client):
+        runner = RQRunner(conn, client, queues=["fast"])
+        runner.enqueue_with(double, args=(1,), queue="fast")
+
+        assert (runner.depth("fast"), runner.depth("default")) == (1, 0)
+
+        with pytest.raises(KeyError):
+            runner.enqueue_with(double, args=(1,), queue="missing")
+
+    def test_name_is_default_queue(self, conn, client):
+        runner = RQRunner(conn, client, name="training")
+        runner.enqueue(double, 1)
+
+        assert [q.name for q in runner.queues] == ["training"]
+        assert runner.depth("training") == 1
+
+    def test_queue_stats(self, conn, client):
+        runner = RQRunner(conn, client, queues=["fast"], router=Router().add("fast", function=double))
+        runner.enqueue(double, 1)
+        runner.enqueue(fail)
+
+        stats = runner.queue_stats()
+
+        assert list(stats) == ["fast", "default"]
+        assert stats["fast"]["depth"] == 1
+        assert stats["fast"]["oldest"] >= 0.0
+
+        work(runner, conn)
+        stats = runner.queue_stats()
+
+        assert (stats["fast"]["depth"], stats["default"]["depth"]) == (0, 0)
+        assert stats["fast"]["wait"]["count"] == 1
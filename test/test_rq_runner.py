@@ -0,0 +1,46 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import RQRunner
+from .tasks import double, fail, work
+
+
+@pytest.fixture
+def runner(conn, client):
+    return RQRunner(conn, client)
+
+
+class TestRQRunner(object):
+    def test_returns_result(self, runner, conn):
+        key = runner.enqueue(double, 21)
+
+        assert runner.depth() == 1
+
+        work(runner, conn)
+
+        assert runner.wait(key, 5.0) == Status.Done
+        assert runner.get_result(key) == 42
+
+    def test_single_job_per_task(self, runner, conn):
+        runner.enqueue(double, 1)
+
+        assert len(conn.keys("rq:job:*")) == 1
+
+    def test_failure(self, runner, conn):
+        key = runner.enqueue(fail)
+
+        work(runner, conn)
+
+        assert runner.wait(key, 5.0) == Status.Failed
+        assert runner.get_exception(key).type_ == "ValueError"
+
+    def test_done_within_job(self, runner, conn):
+        keys = runner.enqueue_many(double, [(i,) for i in range(3)])
+
+        work(runner, conn)
+
+        # NB: no dependent job is needed, the tasks are marked as done by the job itself
+        assert [runner.check_status(k) for k in keys] == [Status.Done] * 3
+        assert len(conn.keys("rq:job:*")) == 3
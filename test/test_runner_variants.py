@@ -0,0 +1,43 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import ProcessPoolRunner, AsyncioRunner
+from .tasks import double, fail, double_async, fail_async
+
+
+class TestProcessPoolRunner(object):
+    def test_wait_returns_result(self, client):
+        runner = ProcessPoolRunner(client, max_workers=1)
+        key = runner.enqueue(double, 21)
+
+        assert runner.wait(key, 30.0) == Status.Done
+        assert runner.get_result(key) == 42
+
+    def test_failure(self, client):
+        runner = ProcessPoolRunner(client, max_workers=1)
+        key = runner.enqueue(fail)
+
+        assert runner.wait(key, 30.0) == Status.Failed
+        assert runner.get_exception(key).type_ == "ValueError"
+
+
+class TestAsyncioRunner(object):
+    def test_wait_returns_result(self, client):
+        runner = AsyncioRunner(client)
+        keys = runner.enqueue_many(double_async, [(i,) for i in range(10)])
+
+        assert [runner.wait(k, 5.0) for k in keys] == [Status.Done] * 10
+        assert [runner.get_result(k) for k in keys] == [2 * i for i in range(10)]
+
+    def test_failure(self, client):
+        runner = AsyncioRunner(client)
+        key = runner.enqueue(fail_async)
+
+        assert runner.wait(key, 5.0) == Status.Failed
+        assert runner.get_exception(key).type_ == "ValueError"
+
+    def test_requires_coroutine_function(self, client):
+        with pytest.raises(TypeError):
+            AsyncioRunner(client).enqueue(double, 1)
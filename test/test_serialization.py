@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pylurch.contract.enums import Encoding
+from pylurch.contract.serialization import encode, decode
+
+
+@pytest.fixture
+def frame():
+    index = pd.Index([10, 11, 12], name="row")
+
+    return pd.DataFrame(
+        {"a": np.array([1.0, 2.0, 3.0], dtype=np.float32), "b": [1, 2, 3], "c": ["x", "y", "z"]}, index=index
+    )
+
+
+class TestSerialization(object):
+    def test_json(self, frame):
+        decoded = decode(encode(frame))
+
+        assert list(decoded.columns) == list(frame.columns)
+        assert np.allclose(decoded["a"], frame["a"])
+
+    @pytest.mark.parametrize("encoding", [Encoding.Npy, Encoding.Arrow])
+    def test_frame_roundtrip(self, frame, encoding):
+        if encoding == Encoding.Arrow:
+            pytest.importorskip("pyarrow")
+
+        assert_frame_equal(decode(encode(frame, encoding), encoding), frame)
+
+    @pytest.mark.parametrize("encoding", [Encoding.Npy, Encoding.Arrow])
+    def test_unnamed_index(self, frame, encoding):
+        if encoding == Encoding.Arrow:
+            pytest.importorskip("pyarrow")
+
+        frame.index.name = None
+
+        assert decode(encode(frame, encoding), encoding).index.name is None
+
+    def test_npy_array_roundtrip(self):
+        x = np.random.rand(10, 3).astype(np.float32)
+        decoded = decode(encode(x, Encoding.Npy), Encoding.Npy)
+
+        assert decoded.dtype == np.float32
+        assert np.array_equal(decoded, x)
+
+    def test_arrow_array(self):
+        pytest.importorskip("pyarrow")
+
+        x = np.random.rand(10, 3)
+        decoded = decode(encode(x, Encoding.Arrow), Encoding.Arrow)
+
+        assert np.array_equal(decoded.to_numpy(), x)
+
+    def test_npy_object_columns_as_strings(self):
+        frame = pd.DataFrame({"a": [1, "b"]})
+        decoded = decode(encode(frame, Encoding.Npy), Encoding.Npy)
+
+        assert list(decoded["a"]) == ["1", "b"]
@@ -0,0 +1,105 @@
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from pylurch.contract import database as db
+from pylurch.server.sessions import begin_session
+
+
+@pytest.fixture
+def factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    db.Base.metadata.create_all(engine)
+
+    return sessionmaker(bind=engine)
+
+
+class TestBeginSession(object):
+    def test_increments_version(self, factory):
+        session = factory()
+
+        first = begin_session(session, "train", model_name="m", model_revision="1")
+        second = begin_session(session, "train", model_name="m", model_revision="1")
+
+        assert (first.version, second.version) == (1, 2)
+        assert first.model_id == second.model_id
+        assert not second.has_model
+
+    def test_retries_on_version_conflict(self, factory):
+        session = factory()
+        model_id = begin_session(session, "other", model_name="m", model_revision="1").model_id
+
+        conflicts = list()
+
+        # NB: claims the version in another transaction just before the first attempt is flushed
+        @event.listens_for(session, "before_flush")
+        def claim(*_):
+            if conflicts:
+                return
+
+            other = factory()
+            other.add(db.TrainingSession(model_id=model_id, name="train", version=1, has_model=False))
+            other.commit()
+            other.close()
+
+            conflicts.append(1)
+
+        training_session = begin_session(session, "train", model_name="m", model_revision="1")
+
+        assert conflicts
+        assert training_session.version == 2
+
+    def test_update_requires_model(self, factory):
+        session = factory()
+        old = begin_session(session, "train", model_name="m", model_revision="1")
+
+        with pytest.raises(ValueError):
+            begin_session(session, "update", old_session_id=old.id)
+
+    def test_requires_model_or_old_session(self, factory):
+        with pytest.raises(ValueError):
+            begin_session(factory(), "train")
+
+
+class TestSessionEndpoint(object):
+    @pytest.fixture
+    def client(self, factory):
+        pytest.importorskip("httpx")
+
+        from starlette.applications import Starlette
+        from starlette.testclient import TestClient
+        from pylurch.server.sessions import make_session_endpoint, SESSION_ENDPOINT
+
+        api = Starlette()
+        api.add_route(f"/{SESSION_ENDPOINT}", make_session_endpoint(factory), methods=["POST"])
+
+        return TestClient(api)
+
+    def test_begins_session(self, client):
+        resp = client.post("/session/begin", json={"session_name": "train", "model_name": "m", "model_revision": "1"})
+
+        assert resp.status_code == 200
+        assert (resp.json()["status"], resp.json()["version"]) == ("Done", 1)
+
+    def test_invalid_request(self, client):
+        resp = client.post("/session/begin", json={"session_name": "train"})
+
+        assert resp.status_code == 400
+        assert resp.json()["status"] == "Failed"
+
+    def test_database_error(self, client, monkeypatch):
+        from sqlalchemy.exc import IntegrityError
+        from pylurch.server import sessions
+
+        def conflict(*args, **kwargs):
+            raise IntegrityError("INSERT", dict(), Exception("UNIQUE constraint failed"))
+
+        monkeypatch.setattr(sessions, "begin_session", conflict)
+
+        resp = client.post("/session/begin", json={"session_name": "train", "model_name": "m", "model_revision": "1"})
+
+        assert resp.status_code == 409
+        assert resp.json()["status"] == "Failed"
+        assert "INSERT" not in resp.json()["message"]
@@ -0,0 +1,93 @@
+import pickle
+import time
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from pylurch.contract import database as db
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.tasks import BaseTask
+from .tasks import double
+
+
+def stored(client, cls, **values):
+    return client.get(cls, lambda u: all(getattr(u, k) == v for k, v in values.items()))
+
+
+@pytest.fixture
+def task(client):
+    return BaseTask(double, client, flush_interval=60.0).initialize()
+
+
+class TestFlush(object):
+    def test_coalesces_status_changes(self, client, task):
+        start = client.requests
+
+        for _ in range(10):
+            task.status = Status.Running
+
+        assert client.requests - start == 1
+
+    def test_coalesces_metadata(self, client, task):
+        task.status = Status.Running
+        start = client.requests
+
+        for i in range(10):
+            task.add_meta("progress", i).update_meta()
+
+        assert client.requests == start
+        assert stored(client, db.TaskMeta, task_id=task.db.id) == []
+
+    def test_terminal_status_writes_pending_changes(self, client, task):
+        task.status = Status.Running
+        task.add_meta("progress", 1.0).add_meta("step", 10)
+
+        start = client.requests
+        task.status = Status.Done
+
+        # NB: one request for the task, and one for its new metadata
+        assert client.requests - start == 2
+        assert stored(client, db.Task, key=task.key)[0].status == Status.Done
+        assert {m.key: m.value for m in stored(client, db.TaskMeta, task_id=task.db.id)} == {
+            "progress": 1.0,
+            "step": 10,
+        }
+
+    def test_writes_once_interval_passed(self, client):
+        task = BaseTask(double, client, flush_interval=0.05).initialize()
+        task.status = Status.Running
+        task.add_meta("progress", 0.5).update_meta()
+
+        assert stored(client, db.TaskMeta, task_id=task.db.id) == []
+
+        time.sleep(0.1)
+        task.update_meta()
+
+        assert [m.value for m in stored(client, db.TaskMeta, task_id=task.db.id)] == [0.5]
+
+    def test_batches_new_and_existing_metadata(self, client, task):
+        task.add_meta("a", 1).add_meta("b", 2).flush()
+        task.add_meta("b", 3).add_meta("c", 4)
+
+        start = client.requests
+        task.flush()
+
+        # NB: one request creating 'c' and one updating 'b'
+        assert client.requests - start == 2
+        assert {m.key: m.value for m in stored(client, db.TaskMeta, task_id=task.db.id)} == {"a": 1, "b": 3, "c": 4}
+
+    def test_flush_without_changes(self, client, task):
+        task.flush()
+        start = client.requests
+
+        task.flush()
+
+        assert client.requests == start
+
+    def test_pickles_pending_changes(self, client, task):
+        task.add_meta("progress", 1.0)
+
+        copy = pickle.loads(pickle.dumps(task))
+        copy.status = Status.Done
+
+        assert [m.value for m in stored(client, db.TaskMeta, task_id=task.db.id)] == [1.0]
@@ -0,0 +1,44 @@
+import asyncio
+import pytest
+
+pytest.importorskip("pyalfred")
+
+from concurrent.futures import ThreadPoolExecutor
+from pylurch.contract.enums import Status
+from pylurch.server.tasking.runners import ExecutorRunner
+from .tasks import double, fail, block
+
+
+@pytest.fixture
+def runner(client):
+    return ExecutorRunner(client, executor=ThreadPoolExecutor(1))
+
+
+class TestWait(object):
+    def test_returns_result(self, runner):
+        key = runner.enqueue(double, 21)
+
+        assert runner.wait(key, 5.0) == Status.Done
+        assert runner.get_result(key) == 42
+        assert runner.check_status(key) == Status.Done
+
+    def test_failure_records_exception(self, runner):
+        key = runner.enqueue(fail)
+
+        assert runner.wait(key, 5.0) == Status.Failed
+        assert runner.get_exception(key).type_ == "ValueError"
+
+    def test_times_out(self, runner):
+        key = block(runner)
+
+        assert runner.wait(key, 0.05) == Status.Running
+
+        runner.cancel(key)
+
+    def test_async(self, runner):
+        key = runner.enqueue(double, 21)
+
+        assert asyncio.run(runner.wait_async(key, 5.0)) == Status.Done
+
+    def test_unknown_key(self, runner):
+        assert runner.wait("missing", 0.05) == Status.Unknown